@@ -1,235 +1,406 @@
 #!/usr/bin/env python3
 """Dagger CI pipeline for nichiyou-daiku project."""
 
+import argparse
+import os
+import shlex
 import sys
-from typing import Optional
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
 
 import anyio
+import anyio.abc
 import dagger
 from dagger import Config, Container, Directory
 
 
-async def test_pipeline(
+# System and bootstrap packages needed by any of the pipelines. They are
+# installed once into a base shared by test, lint and build.
+# Keep in sync with ci/base.Dockerfile.
+APT_PACKAGES = ("git", "libgl1-mesa-dev", "libcairo2-dev")
+PIP_PACKAGES = ("uv", "build")
+
+PIP_CACHE_DIR = "/root/.cache/pip"
+UV_CACHE_DIR = "/root/.cache/uv"
+# Kept outside /src so mounting the sources does not hide the environment
+VENV_DIR = "/opt/venv"
+
+# Checks run by the lint pipeline, in order
+LINT_COMMANDS = (
+    "ruff format --check src/ tests/",
+    "ruff check src/ tests/",
+    "pyright src/nichiyou_daiku",
+)
+
+# Paths of the repository the pipelines actually need
+SOURCE_INCLUDES = [
+    "src",
+    "tests",
+    "pyproject.toml",
+    "uv.lock",
+    "README.md",
+    "LICENSE",
+]
+
+
+def read_ignore_file(path: Path) -> list[str]:
+    """Read exclude patterns from a .dockerignore-style file.
+
+    Blank lines and ``#`` comments are skipped. A missing file yields no
+    patterns.
+    """
+    if not path.exists():
+        return []
+    lines = (line.strip() for line in path.read_text().splitlines())
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def base_container(
     client: dagger.Client,
-    source_dir: Directory,
-    python_version: str = "3.11",
+    python_version: str,
+    apt_packages: tuple[str, ...] = APT_PACKAGES,
+    pip_packages: tuple[str, ...] = PIP_PACKAGES,
 ) -> Container:
-    """Run tests with pytest and coverage."""
-    python = (
-        client.container()
-        .from_(f"python:{python_version}-slim")
-        .with_mounted_directory("/src", source_dir)
-        .with_workdir("/src")
-        .with_exec(["apt-get", "update", "-qq"])
-        .with_exec(
-            [
-                "apt-get",
-                "install",
-                "-y",
-                "--no-install-recommends",
-                "git",
-                "libgl1-mesa-dev",
-                "libcairo2-dev",
-            ]
+    """Create the toolchain image shared by the pipelines.
+
+    The base only depends on the Python version and the package lists, not on
+    the project sources, so its layers can be served from the engine cache
+    (including a registry-backed cache, see ``.github/workflows/ci.yml``)
+    across runs and pipelines.
+
+    If ``$CI_BASE_IMAGE`` is set (e.g.
+    ``ghcr.io/ar90n/nichiyou-daiku/ci-base:py{python_version}``), that
+    prebuilt image from ``ci/base.Dockerfile`` is used and the bootstrap is
+    skipped entirely.
+    """
+    base_image = os.environ.get("CI_BASE_IMAGE")
+    if base_image:
+        container = client.container().from_(
+            base_image.format(python_version=python_version)
         )
-        .with_exec(["pip", "install", "--upgrade", "pip"])
-        .with_exec(["pip", "install", "uv"])
-        .with_exec(["uv", "sync", "--dev", "--all-extras"])
-    )
-
-    # Run pytest with coverage
-    test_result = python.with_exec(
-        [
-            "uv",
-            "run",
-            "pytest",
-            "src/",
-            "tests/",
-            "--doctest-modules",
-            "--cov=nichiyou_daiku",
-            "--cov-report=term-missing",
-            "--cov-report=xml",
-            "--cov-fail-under=90",  # Fail if coverage is less than 90%
-            "-v",
-        ]
-    )
-
-    return test_result
-
-
-async def lint_pipeline(
-    client: dagger.Client,
-    source_dir: Directory,
-    python_version: str = "3.11",
-) -> Container:
-    """Run linting and type checking."""
-    python = (
-        client.container()
-        .from_(f"python:{python_version}-slim")
-        .with_mounted_directory("/src", source_dir)
-        .with_workdir("/src")
-        .with_exec(["apt-get", "update", "-qq"])
-        .with_exec(
+    else:
+        # A single exec keeps the bootstrap in one layer and lets the apt
+        # lists be removed before the layer is committed
+        bootstrap = " && ".join(
             [
-                "apt-get",
-                "install",
-                "-y",
-                "--no-install-recommends",
-                "git",
-                "libgl1-mesa-dev",
-                "libcairo2-dev",
+                "apt-get update -qq",
+                shlex.join(
+                    [
+                        "apt-get",
+                        "install",
+                        "-y",
+                        "--no-install-recommends",
+                        *apt_packages,
+                    ]
+                ),
+                "rm -rf /var/lib/apt/lists/*",
+                "pip install --upgrade pip",
+                shlex.join(["pip", "install", *pip_packages]),
             ]
         )
-        .with_exec(["pip", "install", "--upgrade", "pip"])
-        .with_exec(["pip", "install", "uv"])
-        .with_exec(["uv", "sync", "--dev", "--all-extras"])
-    )
-
-    # Run ruff format
-    format_check = python.with_exec(
-        ["uv", "run", "ruff", "format", "--check", "src/", "tests/"]
-    )
+        container = (
+            client.container()
+            .from_(f"python:{python_version}-slim")
+            .with_mounted_cache(
+                PIP_CACHE_DIR, client.cache_volume(f"pip-cache-py{python_version}")
+            )
+            .with_exec(["bash", "-c", bootstrap])
+        )
 
-    # Run ruff
-    ruff_check = format_check.with_exec(
-        ["uv", "run", "ruff", "check", "src/", "tests/"]
+    # Package caches live in engine cache volumes so wheels downloaded by uv
+    # survive across container builds. The uv cache sits on a different
+    # mount than the virtualenv, hence copy instead of hardlinks.
+    return (
+        container.with_mounted_cache(
+            UV_CACHE_DIR, client.cache_volume(f"uv-cache-py{python_version}")
+        )
+        .with_env_variable("UV_CACHE_DIR", UV_CACHE_DIR)
+        .with_env_variable("UV_LINK_MODE", "copy")
+        .with_env_variable("UV_PROJECT_ENVIRONMENT", VENV_DIR)
     )
 
-    # Run pyright
-    pyright_check = ruff_check.with_exec(["uv", "run", "pyright", "src/nichiyou_daiku"])
-
-    return pyright_check
-
 
-async def build_pipeline(
-    client: dagger.Client,
+def project_container(
+    base: Container,
     source_dir: Directory,
-    python_version: str = "3.11",
+    sync_args: list[str],
 ) -> Container:
-    """Build the package."""
-    python = (
-        client.container()
-        .from_(f"python:{python_version}-slim")
+    """Install the project dependencies and mount the sources.
+
+    Dependencies are synced from ``pyproject.toml`` and ``uv.lock`` alone, so
+    that layer stays cached until the dependencies change. The full source
+    tree is mounted last and only the project itself is installed on top.
+    The committed lockfile is used as-is (``--frozen``), skipping resolution.
+    """
+    return (
+        base.with_workdir("/src")
+        .with_file("/src/pyproject.toml", source_dir.file("pyproject.toml"))
+        .with_file("/src/uv.lock", source_dir.file("uv.lock"))
+        .with_exec(["uv", "sync", "--frozen", *sync_args, "--no-install-project"])
         .with_mounted_directory("/src", source_dir)
-        .with_workdir("/src")
-        .with_exec(["apt-get", "update", "-qq"])
-        .with_exec(["apt-get", "install", "-y", "--no-install-recommends", "git"])
-        .with_exec(["pip", "install", "--upgrade", "pip"])
-        .with_exec(["pip", "install", "uv", "build"])
-        .with_exec(["uv", "sync"])
+        .with_exec(["uv", "sync", "--frozen", *sync_args])
     )
 
-    # Build the package
-    build_result = python.with_exec(["python", "-m", "build"])
 
-    return build_result
+async def export_coverage(result: Container, python_version: str) -> None:
+    """Export the coverage report for GitHub Actions.
+
+    Every Python version exports its own file, so versions running
+    concurrently never write to the same path.
+    """
+    await result.file("/src/coverage.xml").export(f"./coverage-py{python_version}.xml")
+
+
+async def export_dist(result: Container, python_version: str) -> None:
+    """Export the built distributions."""
+    await result.directory("/src/dist").export(f"./dist-py{python_version}")
+
+
+@dataclass(frozen=True)
+class PipelineSpec:
+    """Declarative description of a CI pipeline.
+
+    Attributes:
+        name: Target name used on the command line
+        icon: Emoji prefix for progress messages
+        sync_args: Extra arguments for ``uv sync``
+        steps: Commands run in order on top of the project container
+        export: Coroutine exporting the pipeline's artifacts, if any
+        all_versions: Run on every Python version, or only on the first one
+    """
+
+    name: str
+    icon: str
+    sync_args: tuple[str, ...]
+    steps: tuple[tuple[str, ...], ...]
+    export: Callable[[Container, str], Awaitable[None]] | None = None
+    all_versions: bool = True
+
+
+PIPELINES = (
+    PipelineSpec(
+        name="test",
+        icon="📋",
+        sync_args=("--dev", "--all-extras"),
+        steps=(
+            # Doctests are collected by the same pytest process
+            # (--doctest-modules) rather than a separate doctest run.
+            (
+                "uv",
+                "run",
+                "pytest",
+                "src/",
+                "tests/",
+                "--doctest-modules",
+                "--cov=nichiyou_daiku",
+                "--cov-report=term-missing",
+                "--cov-report=xml",
+                "--cov-fail-under=90",  # Fail if coverage is less than 90%
+                "-v",
+            ),
+        ),
+        export=export_coverage,
+    ),
+    PipelineSpec(
+        name="lint",
+        icon="🔍",
+        sync_args=("--dev", "--all-extras"),
+        steps=(
+            # One exec and one `uv run` environment check for all tools;
+            # && keeps the stop-at-first-failure behaviour
+            (
+                "uv",
+                "run",
+                "bash",
+                "-c",
+                " && ".join(LINT_COMMANDS),
+            ),
+        ),
+        # Linting does not depend on the interpreter; run it once
+        all_versions=False,
+    ),
+    PipelineSpec(
+        name="build",
+        icon="📦",
+        # python -m build needs none of the dev tools
+        sync_args=("--no-dev",),
+        steps=(("python", "-m", "build"),),
+        export=export_dist,
+    ),
+)
+
+# Pipelines that can be requested from the command line
+TARGETS = tuple(spec.name for spec in PIPELINES)
+
+
+def run_spec(base: Container, source_dir: Directory, spec: PipelineSpec) -> Container:
+    """Fold a pipeline's steps over the shared project container."""
+    container = project_container(base, source_dir, list(spec.sync_args))
+    for step in spec.steps:
+        container = container.with_exec(list(step))
+    return container
+
+
+# A unit of work for the scheduler: one pipeline on one Python version
+Job = tuple[str, PipelineSpec]
+
+
+def plan_jobs(python_versions: list[str], targets: frozenset[str]) -> list[Job]:
+    """Expand the requested targets into (python_version, spec) jobs.
+
+    Pipelines with ``all_versions=False`` only run on the first version.
+    """
+    return [
+        (python_version, spec)
+        for index, python_version in enumerate(python_versions)
+        for spec in PIPELINES
+        if spec.name in targets and (spec.all_versions or index == 0)
+    ]
+
+
+async def run_job(
+    base: Container,
+    source_dir: Directory,
+    python_version: str,
+    spec: PipelineSpec,
+) -> bool:
+    """Evaluate one pipeline and export its artifacts.
+
+    Returns:
+        True if the pipeline succeeded, False otherwise.
+    """
+    print(f"\n{spec.icon} Running {spec.name} for Python {python_version}...")
+    try:
+        result = await run_spec(base, source_dir, spec).sync()
+        if spec.export is not None:
+            await spec.export(result, python_version)
+    except Exception as e:
+        print(f"❌ {spec.name} failed for Python {python_version}: {e}")
+        return False
+    print(f"✅ {spec.name} passed for Python {python_version}")
+    return True
+
+
+async def schedule(
+    jobs: list[Job],
+    run: Callable[[str, PipelineSpec], Awaitable[bool]],
+    worker_count: int,
+) -> list[bool]:
+    """Run jobs on a fixed pool of workers fed by an unbuffered channel.
+
+    Each worker pulls the next job as soon as it finishes its current one,
+    so fast pipelines do not wait for slow ones and at most
+    ``worker_count`` pipelines are in flight at any time.
+    """
+    results: list[bool] = []
+    send_jobs, receive_jobs = anyio.create_memory_object_stream[Job](0)
+
+    async def worker(receive: anyio.abc.ObjectReceiveStream[Job]) -> None:
+        async with receive:
+            async for python_version, spec in receive:
+                results.append(await run(python_version, spec))
+
+    async with anyio.create_task_group() as tg:
+        async with receive_jobs:
+            for _ in range(max(worker_count, 1)):
+                tg.start_soon(worker, receive_jobs.clone())
+        async with send_jobs:
+            for job in jobs:
+                await send_jobs.send(job)
+
+    return results
 
 
 async def main(
-    python_versions: Optional[list[str]] = None,
+    python_versions: list[str] | None = None,
+    targets: list[str] | None = None,
+    max_in_flight: int | None = None,
 ) -> None:
-    """Main CI pipeline orchestrator."""
+    """Main CI pipeline orchestrator.
+
+    Args:
+        python_versions: Python versions to run the pipelines on
+        targets: Subset of TARGETS to run (all of them by default)
+        max_in_flight: Maximum number of pipelines evaluated concurrently.
+            Defaults to $CI_MAX_IN_FLIGHT, or to the number of pipelines
+            capped at the CPU count.
+    """
     if python_versions is None:
         python_versions = ["3.13"]
+    if targets is None:
+        targets = list(TARGETS)
+    if not targets:
+        raise ValueError("No CI targets given")
+    unknown = set(targets) - set(TARGETS)
+    if unknown:
+        raise ValueError(f"Unknown CI targets: {', '.join(sorted(unknown))}")
+    jobs = plan_jobs(python_versions, frozenset(targets))
+    if max_in_flight is None:
+        max_in_flight = int(
+            os.environ.get("CI_MAX_IN_FLIGHT", min(len(jobs), os.cpu_count() or 1))
+        )
 
     config = Config(log_output=sys.stdout)
 
     async with dagger.Connection(config) as client:
-        # Get source directory
+        # Get source directory. Only the paths the pipelines read are
+        # uploaded, minus the patterns listed in .dockerignore. The handle is
+        # created once and shared by every version and pipeline, so the tree
+        # is uploaded and content-hashed a single time per run.
         source = client.host().directory(
             ".",
-            exclude=[
-                ".venv/",
-                "dist/",
-                "build/",
-                "*.egg-info/",
-                "__pycache__/",
-                ".pytest_cache/",
-                ".mypy_cache/",
-                ".ruff_cache/",
-                ".git/",
-                "*.pyc",
-                ".coverage",
-                "coverage.xml",
-            ],
+            include=SOURCE_INCLUDES,
+            exclude=read_ignore_file(Path(".dockerignore")),
         )
+        # Containers are lazy: a base is only evaluated if a job uses it
+        bases = {
+            python_version: base_container(client, python_version)
+            for python_version in python_versions
+        }
 
-        # Run pipelines for each Python version
-        test_results = []
-        lint_results = []
-        build_results = []
-
-        for py_version in python_versions:
-            print(f"\n🐍 Running CI for Python {py_version}")
-
-            # Run tests
-            print("  📋 Running tests...")
-            test_result = await test_pipeline(client, source, py_version)
-            test_results.append(test_result)
-
-            # Run linting (only on one version to save time)
-            if py_version == python_versions[0]:
-                print("  🔍 Running linting...")
-                lint_result = await lint_pipeline(client, source, py_version)
-                lint_results.append(lint_result)
+        async def run(python_version: str, spec: PipelineSpec) -> bool:
+            return await run_job(bases[python_version], source, python_version, spec)
 
-            # Build package
-            print("  📦 Building package...")
-            build_result = await build_pipeline(client, source, py_version)
-            build_results.append(build_result)
-
-        # Execute all pipelines
+        # Independent container DAGs are scheduled in parallel by the engine
         print("\n🚀 Executing all pipelines...")
+        results = await schedule(jobs, run, max_in_flight)
 
-        has_failures = False
-
-        # Execute test results
-        for i, (py_version, test_result) in enumerate(
-            zip(python_versions, test_results)
-        ):
-            print(f"\n📋 Test results for Python {py_version}:")
-            try:
-                await test_result.stdout()
-                # Export coverage.xml for GitHub Actions
-                await test_result.file("/src/coverage.xml").export("./coverage.xml")
-            except Exception as e:
-                print(f"❌ Tests failed for Python {py_version}: {e}")
-                has_failures = True
-
-        # Execute linting results
-        if lint_results:
-            print("\n🔍 Linting results:")
-            try:
-                await lint_results[0].stdout()
-            except Exception as e:
-                print(f"❌ Linting failed: {e}")
-                has_failures = True
-
-        # Execute build results
-        for i, (py_version, build_result) in enumerate(
-            zip(python_versions, build_results)
-        ):
-            print(f"\n📦 Build results for Python {py_version}:")
-            try:
-                await build_result.stdout()
-                # Export built artifacts
-                dist_dir = build_result.directory("/src/dist")
-                await dist_dir.export(f"./dist-py{py_version}")
-            except Exception as e:
-                print(f"❌ Build failed for Python {py_version}: {e}")
-                has_failures = True
-
-        if has_failures:
+        if not all(results):
             print("\n❌ CI pipeline failed!")
             sys.exit(1)
         else:
             print("\n✅ All CI checks passed!")
 
 
-if __name__ == "__main__":
-    # Parse command line arguments
-    python_versions = None
-    if len(sys.argv) > 1:
-        python_versions = sys.argv[1].split(",")
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line of the CI pipeline."""
+
+    def comma_list(value: str) -> list[str]:
+        return [item for item in value.split(",") if item]
 
-    anyio.run(main, python_versions)
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--python-versions",
+        type=comma_list,
+        default=None,
+        help="Comma-separated Python versions (default: 3.13)",
+    )
+    parser.add_argument(
+        "--targets",
+        type=comma_list,
+        default=None,
+        help=f"Comma-separated pipelines to run (default: {','.join(TARGETS)})",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=None,
+        help="Maximum number of pipelines evaluated concurrently",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    anyio.run(main, args.python_versions, args.targets, args.max_in_flight)
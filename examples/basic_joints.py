@@ -38,9 +38,6 @@ from nichiyou_daiku.core.dowel import DowelSpec
 from nichiyou_daiku.core.geometry import FromMax, FromMin
 from nichiyou_daiku.core.assembly import Assembly
 from nichiyou_daiku.core.screw import ScrewSpec, CoarseThreadScrew, as_spec
-from nichiyou_daiku.shell import assembly_to_build123d
-from build123d import Location
-from ocp_vscode import show_object
 
 # We'll create multiple joint examples, showing them separately
 
@@ -227,47 +224,56 @@ screw_model = Model.of(
 # ==============================================================================
 # Visualize all joints
 # ==============================================================================
-
-# Convert each model to assembly and then to build123d
-print("\nConverting to 3D...")
-
-# T-Joint (VanillaConnection)
-t_assembly = Assembly.of(t_joint_model)
-t_compound = assembly_to_build123d(t_assembly, fillet_radius=2.0).moved(
-    Location((0, 300, 0))
-)
-
-# Butt Joint (VanillaConnection)
-butt_assembly = Assembly.of(butt_joint_model)
-butt_compound = assembly_to_build123d(butt_assembly, fillet_radius=2.0).moved(
-    Location((0, 0, 0))
-)
-
-# Corner Joint (VanillaConnection)
-corner_assembly = Assembly.of(corner_joint_model)
-corner_compound = assembly_to_build123d(corner_assembly, fillet_radius=2.0).moved(
-    Location((0, -300, 0))
-)
-
-# Dowel Joint (DowelConnection)
-dowel_assembly = Assembly.of(dowel_model)
-dowel_compound = assembly_to_build123d(dowel_assembly, fillet_radius=2.0).moved(
-    Location((500, 150, 0))
-)
-
-# Screw Joint (ScrewConnection)
-screw_assembly = Assembly.of(screw_model)
-screw_compound = assembly_to_build123d(screw_assembly, fillet_radius=2.0).moved(
-    Location((500, -150, 0))
-)
-
-# Display all joints
-show_object(t_compound)
-show_object(butt_compound)
-show_object(corner_compound)
-show_object(dowel_compound)
-show_object(screw_compound)
-
-print("\nDone! Use OCP CAD Viewer to examine the joints.")
-print("Left side: Joint shapes (T, Butt, Corner) with VanillaConnection")
-print("Right side: Connection types (Dowel, Screw)")
+if __name__ == "__main__":
+    # The model construction above is pure Python; the 3D conversion and the
+    # viewer pull in OpenCascade, so they are only imported when run as a script.
+    from build123d import Location
+    from nichiyou_daiku.shell import assembly_to_build123d
+    from ocp_vscode import show
+
+    # Convert each model to assembly and then to build123d
+    print("\nConverting to 3D...")
+
+    # T-Joint (VanillaConnection)
+    t_assembly = Assembly.of(t_joint_model)
+    t_compound = assembly_to_build123d(t_assembly, fillet_radius=2.0).moved(
+        Location((0, 300, 0))
+    )
+
+    # Butt Joint (VanillaConnection)
+    butt_assembly = Assembly.of(butt_joint_model)
+    butt_compound = assembly_to_build123d(butt_assembly, fillet_radius=2.0).moved(
+        Location((0, 0, 0))
+    )
+
+    # Corner Joint (VanillaConnection)
+    corner_assembly = Assembly.of(corner_joint_model)
+    corner_compound = assembly_to_build123d(corner_assembly, fillet_radius=2.0).moved(
+        Location((0, -300, 0))
+    )
+
+    # Dowel Joint (DowelConnection)
+    dowel_assembly = Assembly.of(dowel_model)
+    dowel_compound = assembly_to_build123d(dowel_assembly, fillet_radius=2.0).moved(
+        Location((500, 150, 0))
+    )
+
+    # Screw Joint (ScrewConnection)
+    screw_assembly = Assembly.of(screw_model)
+    screw_compound = assembly_to_build123d(screw_assembly, fillet_radius=2.0).moved(
+        Location((500, -150, 0))
+    )
+
+    # Display all joints in a single viewer round-trip
+    show(
+        t_compound,
+        butt_compound,
+        corner_compound,
+        dowel_compound,
+        screw_compound,
+        names=["t_joint", "butt_joint", "corner_joint", "dowel_joint", "screw_joint"],
+    )
+
+    print("\nDone! Use OCP CAD Viewer to examine the joints.")
+    print("Left side: Joint shapes (T, Butt, Corner) with VanillaConnection")
+    print("Right side: Connection types (Dowel, Screw)")
@@ -13,8 +13,6 @@ from nichiyou_daiku.core.geometry import FromMin
 from nichiyou_daiku.core.assembly import Assembly
 from nichiyou_daiku.shell import assembly_to_build123d
 
-from ocp_vscode import show
-
 try:
     from utils import get_connection_summary
 except ImportError:
@@ -62,8 +60,11 @@ compound = assembly_to_build123d(
     fillet_radius=3.0,  # 3mm radius for rounded edges
 )
 
-# Display in OCP CAD Viewer
-show(compound)
+# Display in OCP CAD Viewer; the viewer is only imported when run as a script
+if __name__ == "__main__":
+    from ocp_vscode import show
+
+    show(compound)
 
 print("Corner angle joint created successfully!")
 print("This forms a clean 90-degree corner connection.")
@@ -10,6 +10,43 @@ from nichiyou_daiku.shell import assembly_to_build123d
 from build123d import Location
 from ocp_vscode import show_object
 
+# All examples join two 2x4 pieces, so their DSL only differs in the piece
+# names, lengths and the two anchors of the connection
+JOINT_DSL_TEMPLATE = """
+({base}:2x4 {{"length": {base_length}}})
+({target}:2x4 {{"length": {target_length}}})
+
+{base} -[{base_anchor}
+         {target_anchor}]- {target}
+"""
+
+
+def _anchor_dsl(contact_face: str, edge_shared_face: str, offset: str) -> str:
+    return (
+        f'{{"contact_face": "{contact_face}", '
+        f'"edge_shared_face": "{edge_shared_face}", "offset": {offset}}}'
+    )
+
+
+def joint_dsl(
+    base: str,
+    base_length: float,
+    target: str,
+    target_length: float,
+    base_anchor: tuple[str, str, str],
+    target_anchor: tuple[str, str, str],
+) -> str:
+    """Fill the two-piece joint template."""
+    return JOINT_DSL_TEMPLATE.format(
+        base=base,
+        base_length=base_length,
+        target=target,
+        target_length=target_length,
+        base_anchor=_anchor_dsl(*base_anchor),
+        target_anchor=_anchor_dsl(*target_anchor),
+    )
+
+
 # We'll create multiple joint examples, showing them separately
 
 # ==============================================================================
@@ -18,13 +55,14 @@ from ocp_vscode import show_object
 print("Building T-Joint example...")
 
 # T-Joint: Connect upright to the middle of base beam
-t_joint_dsl = """
-(t_base:2x4 {"length": 800})
-(t_upright:2x4 {"length": 400})
-
-t_base -[{"contact_face": "front", "edge_shared_face": "right", "offset": FromMin(400)}
-         {"contact_face": "down", "edge_shared_face": "front", "offset": FromMin(44.5)}]- t_upright
-"""
+t_joint_dsl = joint_dsl(
+    "t_base",
+    800,
+    "t_upright",
+    400,
+    ("front", "right", "FromMin(400)"),
+    ("down", "front", "FromMin(44.5)"),
+)
 
 t_joint_model = parse_dsl(t_joint_dsl)
 
@@ -34,13 +72,14 @@ t_joint_model = parse_dsl(t_joint_dsl)
 print("Building Butt Joint example...")
 
 # Butt Joint: Connect end-to-end
-butt_joint_dsl = """
-(butt_first:2x4 {"length": 300})
-(butt_second:2x4 {"length": 300})
-
-butt_first -[{"contact_face": "top", "edge_shared_face": "left", "offset": FromMin(0)}
-             {"contact_face": "down", "edge_shared_face": "left", "offset": FromMin(0)}]- butt_second
-"""
+butt_joint_dsl = joint_dsl(
+    "butt_first",
+    300,
+    "butt_second",
+    300,
+    ("top", "left", "FromMin(0)"),
+    ("down", "left", "FromMin(0)"),
+)
 
 butt_joint_model = parse_dsl(butt_joint_dsl)
 
@@ -50,13 +89,14 @@ butt_joint_model = parse_dsl(butt_joint_dsl)
 print("Building Corner Joint example...")
 
 # Corner Joint: Two pieces meeting at 90 degrees
-corner_joint_dsl = """
-(corner_a:2x4 {"length": 400})
-(corner_b:2x4 {"length": 400})
-
-corner_a -[{"contact_face": "back", "edge_shared_face": "right", "offset": FromMin(0)}
-           {"contact_face": "left", "edge_shared_face": "front", "offset": FromMin(0)}]- corner_b
-"""
+corner_joint_dsl = joint_dsl(
+    "corner_a",
+    400,
+    "corner_b",
+    400,
+    ("back", "right", "FromMin(0)"),
+    ("left", "front", "FromMin(0)"),
+)
 
 corner_joint_model = parse_dsl(corner_joint_dsl)
 
@@ -6,6 +6,8 @@ using DSL syntax. The shelf has 4 legs with aprons and shelving
 on both bottom and top levels.
 """
 
+import io
+
 from nichiyou_daiku.dsl import parse_dsl
 from nichiyou_daiku.core.piece import PieceType, get_shape
 from nichiyou_daiku.core.assembly import Assembly
@@ -15,13 +17,27 @@ from nichiyou_daiku.shell import (
     generate_markdown_report,
 )
 
-from ocp_vscode import show
-
 
 def _calc_apron_length(length: float, leg_inset_length: float) -> float:
     return length - 2 * leg_inset_length
 
 
+def _calc_table_top_layout(
+    span: float, piece_width: float, desired_interval: float
+) -> tuple[int, float]:
+    """Return how many table top pieces fit on span and the gap between them.
+
+    The count is the largest n with n * piece_width + (n - 1) * gap <= span
+    for gap >= desired_interval; rounding the quotient up instead would
+    squeeze in a piece that does not fit. The remaining length is spread
+    evenly over the gaps. A single piece has no gap to spread it over.
+    """
+    num = int((span - piece_width) / (piece_width + desired_interval)) + 1
+    if num <= 1:
+        return 1, 0.0
+    return num, (span - num * piece_width) / (num - 1)
+
+
 # ============================================================================
 # SHELF DIMENSIONS
 # ============================================================================
@@ -33,34 +49,34 @@ SHELF_HEIGHT = 750.0
 BOTTOM_APRON_HEIGHT = 150.0  # Distance from bottom of leg to apron
 TOP_APRON_HEIGHT = 250.0     # Distance from top of leg to apron
 
+# Lumber cross-sections used throughout the layout
+_2X4_HEIGHT = get_shape(PieceType.PT_2x4).height
+_2X4_WIDTH = get_shape(PieceType.PT_2x4).width
+_1X4_WIDTH = get_shape(PieceType.PT_1x4).width
+
+# Side aprons of the bottom level sit higher than its front and back aprons
+bottom_side_apron_height = BOTTOM_APRON_HEIGHT + 150
+
 # Calculate apron lengths
-apron_front_back_length = _calc_apron_length(
-    SHELF_WIDTH, get_shape(PieceType.PT_2x4).height
-)
-apron_left_right_length = _calc_apron_length(
-    SHELF_DEPTH, get_shape(PieceType.PT_2x4).width
-)
+apron_front_back_length = _calc_apron_length(SHELF_WIDTH, _2X4_HEIGHT)
+apron_left_right_length = _calc_apron_length(SHELF_DEPTH, _2X4_WIDTH)
 
 # table top parameters
 desired_table_top_piece_interval = 10.0  # Desired interval between tabletop pieces
-table_top_piece_num = (
-    int(
-        (apron_front_back_length - get_shape(PieceType.PT_1x4).width)
-        / (get_shape(PieceType.PT_1x4).width + desired_table_top_piece_interval)
-    )
-    + 1
+table_top_piece_num, table_top_piece_interval = _calc_table_top_layout(
+    apron_front_back_length, _1X4_WIDTH, desired_table_top_piece_interval
 )
-table_top_piece_interval = (
-    apron_front_back_length - table_top_piece_num * get_shape(PieceType.PT_1x4).width
-) / (table_top_piece_num - 1)
 
 
 # ============================================================================
 # CREATE SHELF USING DSL
 # ============================================================================
 
-# Build DSL string with calculated dimensions
-shelf_dsl = f"""
+# Build DSL string with calculated dimensions. Each statement is printed
+# into a single growing buffer instead of concatenating strings
+shelf_buf = io.StringIO()
+print(
+    f"""
 // Shelf Design
 // Dimensions: {SHELF_WIDTH}mm x {SHELF_DEPTH}mm x {SHELF_HEIGHT}mm
 
@@ -84,18 +100,21 @@ shelf_dsl = f"""
 (top_apron_right:2x4 ={apron_left_right_length})
 (top_apron_front:2x4 ={apron_front_back_length})
 (top_apron_back:2x4 ={apron_front_back_length})
-"""
+""",
+    file=shelf_buf,
+)
 
 # Add bottom table top pieces
 for i in range(table_top_piece_num):
-    shelf_dsl += f"(bottom_table_top_{i}:1x4 ={SHELF_DEPTH})\n"
+    print(f"(bottom_table_top_{i}:1x4 ={SHELF_DEPTH})", file=shelf_buf)
 
 # Add top table top pieces
 for i in range(table_top_piece_num):
-    shelf_dsl += f"(top_table_top_{i}:1x4 ={SHELF_DEPTH})\n"
+    print(f"(top_table_top_{i}:1x4 ={SHELF_DEPTH})", file=shelf_buf)
 
 # Add connections
-shelf_dsl += f"""
+print(
+    f"""
 // Front table top apron connections (bottom level)
 leg_left_front -[BL>{BOTTOM_APRON_HEIGHT} DR>0 D(4.0, 20.0)]- bottom_table_top_apron_front
 leg_right_front -[FR>{BOTTOM_APRON_HEIGHT} TL>0 D(4.0, 20.0)]- bottom_table_top_apron_front
@@ -113,12 +132,12 @@ leg_left_back -[BL<{TOP_APRON_HEIGHT} DR<0 D(4.0, 20.0)]- top_table_top_apron_ba
 leg_right_back -[FR<{TOP_APRON_HEIGHT} TL<0 D(4.0, 20.0)]- top_table_top_apron_back
 
 // Bottom side apron connections
-leg_left_front -[RF>{BOTTOM_APRON_HEIGHT + 150} TF<0 D(4.0, 20.0)]- bottom_apron_left
-leg_left_back -[LF>{BOTTOM_APRON_HEIGHT + 150} DF<0 D(4.0, 20.0)]- bottom_apron_left
-leg_right_front -[RB>{BOTTOM_APRON_HEIGHT + 150} DF<0 D(4.0, 20.0)]- bottom_apron_right
-leg_right_back -[LB>{BOTTOM_APRON_HEIGHT + 150} TF<0 D(4.0, 20.0)]- bottom_apron_right
-leg_left_back -[BR>{BOTTOM_APRON_HEIGHT + 150} DB<0 D(4.0, 20.0)]- bottom_apron_back
-leg_right_back -[FR>{BOTTOM_APRON_HEIGHT + 150} TB<0 D(4.0, 20.0)]- bottom_apron_back
+leg_left_front -[RF>{bottom_side_apron_height} TF<0 D(4.0, 20.0)]- bottom_apron_left
+leg_left_back -[LF>{bottom_side_apron_height} DF<0 D(4.0, 20.0)]- bottom_apron_left
+leg_right_front -[RB>{bottom_side_apron_height} DF<0 D(4.0, 20.0)]- bottom_apron_right
+leg_right_back -[LB>{bottom_side_apron_height} TF<0 D(4.0, 20.0)]- bottom_apron_right
+leg_left_back -[BR>{bottom_side_apron_height} DB<0 D(4.0, 20.0)]- bottom_apron_back
+leg_right_back -[FR>{bottom_side_apron_height} TB<0 D(4.0, 20.0)]- bottom_apron_back
 
 // Top side apron connections
 leg_left_front -[RF<0 TF<0 D(4.0, 20.0)]- top_apron_left
@@ -129,19 +148,25 @@ leg_left_back -[BR<0 DB<0 D(4.0, 20.0)]- top_apron_back
 leg_right_back -[FR<0 TB<0 D(4.0, 20.0)]- top_apron_back
 leg_left_front -[BL<0 DF<0 D(4.0, 20.0)]- top_apron_front
 leg_right_front -[FL<0 TF<0 D(4.0, 20.0)]- top_apron_front
-"""
+""",
+    file=shelf_buf,
+)
+
+# Offsets of the table top pieces along the aprons, shared by both levels
+table_top_step = _1X4_WIDTH + table_top_piece_interval
+table_top_offsets = [f"{i * table_top_step:.3f}" for i in range(table_top_piece_num)]
 
 # Add bottom table top piece connections
-for i in range(table_top_piece_num):
-    offset = i * (get_shape(PieceType.PT_1x4).width + table_top_piece_interval)
-    shelf_dsl += f"bottom_table_top_apron_front -[FR>{offset:.3f} FT>0 D(4.0, 20.0)]- bottom_table_top_{i}\n"
-    shelf_dsl += f"bottom_table_top_apron_back -[FL>{offset:.3f} FD>0 D(4.0, 20.0)]- bottom_table_top_{i}\n"
+for i, offset in enumerate(table_top_offsets):
+    print(f"bottom_table_top_apron_front -[FR>{offset} FT>0 D(4.0, 20.0)]- bottom_table_top_{i}", file=shelf_buf)
+    print(f"bottom_table_top_apron_back -[FL>{offset} FD>0 D(4.0, 20.0)]- bottom_table_top_{i}", file=shelf_buf)
 
 # Add top table top piece connections
-for i in range(table_top_piece_num):
-    offset = i * (get_shape(PieceType.PT_1x4).width + table_top_piece_interval)
-    shelf_dsl += f"top_table_top_apron_front -[FR>{offset:.3f} FT>0 D(4.0, 20.0)]- top_table_top_{i}\n"
-    shelf_dsl += f"top_table_top_apron_back -[FL>{offset:.3f} FD>0 D(4.0, 20.0)]- top_table_top_{i}\n"
+for i, offset in enumerate(table_top_offsets):
+    print(f"top_table_top_apron_front -[FR>{offset} FT>0 D(4.0, 20.0)]- top_table_top_{i}", file=shelf_buf)
+    print(f"top_table_top_apron_back -[FL>{offset} FD>0 D(4.0, 20.0)]- top_table_top_{i}", file=shelf_buf)
+
+shelf_dsl = shelf_buf.getvalue()
 
 # Parse DSL to create model
 print("Parsing shelf DSL...")
@@ -191,8 +216,11 @@ print("\nBuilding 3D visualization...")
 # Export with smaller fillet radius for sharper edges
 compound = assembly_to_build123d(assembly, fillet_radius=2.0)
 
-# Display the result
-show(compound)
+# Display the result; the viewer is only imported when run as a script
+if __name__ == "__main__":
+    from ocp_vscode import show
+
+    show(compound)
 
 print("\nShelf assembly complete!")
 print(f"Shelf dimensions: {SHELF_WIDTH}mm x {SHELF_DEPTH}mm x {SHELF_HEIGHT}mm")
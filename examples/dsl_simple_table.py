@@ -4,12 +4,13 @@ This example demonstrates how to build a simple table structure
 with legs positioned inside a rectangular frame using DSL syntax.
 """
 
-from nichiyou_daiku.dsl import parse_dsl
-from nichiyou_daiku.core.piece import PieceType, get_shape
-from nichiyou_daiku.core.assembly import Assembly
-from nichiyou_daiku.shell import assembly_to_build123d
+from functools import cache
+from typing import NamedTuple
+
+import numpy as np
 
-from ocp_vscode import show
+from nichiyou_daiku.dsl import parse_dsl_stream
+from nichiyou_daiku.core.piece import PieceType, get_shape
 
 
 # ============================================================================
@@ -20,28 +21,54 @@ TABLE_DEPTH = 600.0  # 60cm deep
 TABLE_HEIGHT = 720.0  # 72cm tall (standard dining table height)
 
 # Calculate insets based on lumber dimensions
-LEG_INSET_DEPTH = get_shape(PieceType.PT_2x4).height
-LEG_INSET_WIDTH = get_shape(PieceType.PT_2x4).width
+_2X4_SHAPE = get_shape(PieceType.PT_2x4)
+LEG_INSET_DEPTH = _2X4_SHAPE.height
+LEG_INSET_WIDTH = _2X4_SHAPE.width
 
 # Apron positioning
 APRON_HEIGHT = 100.0  # Distance from top of leg to apron
 
-# Calculate apron lengths
-apron_front_back_length = TABLE_WIDTH - 2 * LEG_INSET_WIDTH
-apron_left_right_length = TABLE_DEPTH - 2 * LEG_INSET_DEPTH
 
-# Tabletop calculations
+class TableParams(NamedTuple):
+    apron_front_back_length: float
+    apron_left_right_length: float
+    table_top_piece_interval: float
+
+
+@cache
+def _calc_table_params(width: float, depth: float, piece_num: int) -> TableParams:
+    """Return the apron lengths and the gap between the table top pieces.
+
+    Everything derived from the table dimensions is computed in one place and
+    memoized, so sweeping over table variants reuses repeated layouts.
+    """
+    apron_front_back = width - 2 * LEG_INSET_WIDTH
+    apron_left_right = depth - 2 * LEG_INSET_DEPTH
+    interval = (apron_front_back - piece_num * _2X4_SHAPE.width) / (piece_num + 1)
+    return TableParams(apron_front_back, apron_left_right, interval)
+
+
+# Calculate apron lengths and tabletop layout
 table_top_piece_num = 6
-table_top_piece_interval = (
-    apron_front_back_length - table_top_piece_num * get_shape(PieceType.PT_2x4).width
-) / (table_top_piece_num + 1)
+apron_front_back_length, apron_left_right_length, table_top_piece_interval = (
+    _calc_table_params(TABLE_WIDTH, TABLE_DEPTH, table_top_piece_num)
+)
 
 # ============================================================================
 # CREATE TABLE USING DSL
 # ============================================================================
 
+# Table top boards: the two outer ones rest on the legs, the middle ones on
+# the front apron
+TABLE_TOP_PIECE_TEMPLATE = '(table_top_{i}:2x4 {{"length": {length}}})'
+TABLE_TOP_CONNECTION_TEMPLATE = """
+apron_front -[{{"contact_face": "right", "edge_shared_face": "front", "offset": FromMin({offset})}}
+               {{"contact_face": "back", "edge_shared_face": "top", "offset": FromMin(0)}}]- table_top_{i}
+"""
+
 # Build DSL string with calculated dimensions
-table_dsl = f"""
+table_parts = [
+    f"""
 (leg_1:2x4 {{"length": {TABLE_HEIGHT}}})
 (leg_2:2x4 {{"length": {TABLE_HEIGHT}}})
 (leg_3:2x4 {{"length": {TABLE_HEIGHT}}})
@@ -52,14 +79,12 @@ table_dsl = f"""
 (apron_left:2x4 {{"length": {apron_left_right_length}}})
 (apron_right:2x4 {{"length": {apron_left_right_length}}})
 
-(table_top_1:2x4 {{"length": {TABLE_DEPTH}}})
-(table_top_2:2x4 {{"length": {TABLE_DEPTH}}})
-(table_top_3:2x4 {{"length": {TABLE_DEPTH}}})
-(table_top_4:2x4 {{"length": {TABLE_DEPTH}}})
-(table_top_5:2x4 {{"length": {TABLE_DEPTH}}})
-(table_top_6:2x4 {{"length": {TABLE_DEPTH}}})
-(table_top_7:2x4 {{"length": {TABLE_DEPTH}}})
-(table_top_8:2x4 {{"length": {TABLE_DEPTH}}})
+""",
+    "\n".join(
+        TABLE_TOP_PIECE_TEMPLATE.format(i=i, length=TABLE_DEPTH)
+        for i in range(1, table_top_piece_num + 3)
+    ),
+    f"""
 
 leg_1 -[{{"contact_face": "left", "edge_shared_face": "back", "offset": FromMax(0)}}
         {{"contact_face": "down", "edge_shared_face": "back", "offset": FromMax(0)}}]- apron_front
@@ -88,36 +113,48 @@ leg_4 -[{{"contact_face": "front", "edge_shared_face": "left", "offset": FromMin
 table_top_1 -[{{"contact_face": "back", "edge_shared_face": "down", "offset": FromMin(0)}}
               {{"contact_face": "top", "edge_shared_face": "front", "offset": FromMin(0)}}]- leg_1
 
-table_top_8 -[{{"contact_face": "back", "edge_shared_face": "down", "offset": FromMin(0)}}
+table_top_{table_top_piece_num + 2} -[{{"contact_face": "back", "edge_shared_face": "down", "offset": FromMin(0)}}
               {{"contact_face": "top", "edge_shared_face": "front", "offset": FromMin(0)}}]- leg_2
-"""
+""",
+]
 
 # Add connections for middle table top pieces to front apron
-for i in range(2, 8):
-    offset = (i - 2) * LEG_INSET_WIDTH + (i - 1) * table_top_piece_interval
-    table_dsl += f"""
-apron_front -[{{"contact_face": "right", "edge_shared_face": "front", "offset": FromMin({offset})}}
-               {{"contact_face": "back", "edge_shared_face": "top", "offset": FromMin(0)}}]- table_top_{i}
-"""
-
-# Parse DSL to create model
-model = parse_dsl(table_dsl)
+# Board k (k = 0, 1, ...) sits after k boards and k + 1 gaps
+board_index = np.arange(table_top_piece_num)
+table_top_offsets = (
+    board_index * LEG_INSET_WIDTH + (board_index + 1) * table_top_piece_interval
+).tolist()
+table_parts.extend(
+    TABLE_TOP_CONNECTION_TEMPLATE.format(i=i, offset=offset)
+    for i, offset in enumerate(table_top_offsets, start=2)
+)
+
+# Parse DSL to create model; every part ends on a statement boundary, so the
+# parts are parsed one by one without joining them into a single document
+model = parse_dsl_stream(table_parts)
 
 # ============================================================================
 # VISUALIZE
 # ============================================================================
-print("Building simple table...")
-assembly = Assembly.of(model)
-
-# Export with smaller fillet radius for sharper edges
-compound = assembly_to_build123d(assembly, fillet_radius=2.0)
-
-# Display the result
-show(compound)
-
-print("\nSimple table assembly complete!")
-print(f"Table frame dimensions: {TABLE_WIDTH}mm x {TABLE_DEPTH}mm")
-print(f"Table height: {TABLE_HEIGHT}mm")
-print(f"Using {len(model.pieces)} pieces with {len(model.connections)} connections")
-print("\nNote: The tabletop would be added on top of this frame structure.")
+# The 3D conversion and the viewer pull in OpenCascade, so they only run when
+# executed as a script; importing this module just builds the model
+if __name__ == "__main__":
+    from nichiyou_daiku.core.assembly import Assembly
+    from nichiyou_daiku.shell import assembly_to_build123d
+    from ocp_vscode import show
+
+    print("Building simple table...")
+    assembly = Assembly.of(model)
+
+    # Export with smaller fillet radius for sharper edges
+    compound = assembly_to_build123d(assembly, fillet_radius=2.0)
+
+    # Display the result
+    show(compound)
+
+    print("\nSimple table assembly complete!")
+    print(f"Table frame dimensions: {TABLE_WIDTH}mm x {TABLE_DEPTH}mm")
+    print(f"Table height: {TABLE_HEIGHT}mm")
+    print(f"Using {len(model.pieces)} pieces with {len(model.connections)} connections")
+    print("\nNote: The tabletop would be added on top of this frame structure.")
 # %%
@@ -53,14 +53,16 @@ filename = "dining_table_report.md"
 with open(filename, "w", encoding="utf-8") as f:
     f.write(report)
 
-print(f"✅ Report saved to: {filename}")
-print("\n📋 Report Contents Preview:")
-print("=" * 80)
-print(report[:1200])
-print("...")
-print("=" * 80)
-
-print(f"\n🔧 Total pieces: {resources.total_pieces}")
-print(f"📏 Lumber types: {list(resources.pieces_by_type.keys())}")
-print(f"📦 Optimized for metric standard lengths")
-print(f"💾 Full report available in {filename}")
\ No newline at end of file
+summary = [
+    f"✅ Report saved to: {filename}",
+    "\n📋 Report Contents Preview:",
+    "=" * 80,
+    report[:1200],
+    "...",
+    "=" * 80,
+    f"\n🔧 Total pieces: {resources.total_pieces}",
+    f"📏 Lumber types: {list(resources.pieces_by_type.keys())}",
+    "📦 Optimized for metric standard lengths",
+    f"💾 Full report available in {filename}",
+]
+print("\n".join(summary))
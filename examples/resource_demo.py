@@ -1,5 +1,7 @@
 """Simple demonstration of resource extraction feature."""
 
+import numpy as np
+
 from nichiyou_daiku.core.model import Model
 from nichiyou_daiku.core.piece import Piece, PieceType
 from nichiyou_daiku.core.assembly import Assembly
@@ -44,17 +46,23 @@ json_output = resources.model_dump_json(indent=2)
 print(json_output)
 
 # Show shopping list format
-print("\n\n=== Shopping List ===")
-print("To build this table, you need:")
+lines = ["\n\n=== Shopping List ===", "To build this table, you need:"]
 for piece_type, count in resources.pieces_by_type.items():
     total_length = resources.total_length_by_type[piece_type]
     # Convert to meters for easier reading
     length_m = total_length / 1000
-    print(f"- {piece_type.value}: {count} pieces, total {length_m:.1f} meters")
+    lines.append(f"- {piece_type.value}: {count} pieces, total {length_m:.1f} meters")
 
 # Calculate standard lumber needs (assuming 2.4m standard length)
-print("\n=== Standard Lumber Purchase ===")
+lines.append("\n=== Standard Lumber Purchase ===")
 standard_length = 2400.0  # 2.4m in mm
-for piece_type, total_length in resources.total_length_by_type.items():
-    boards_needed = int(total_length / standard_length) + (1 if total_length % standard_length > 0 else 0)
-    print(f"- {piece_type.value} boards (2.4m each): {boards_needed}")
\ No newline at end of file
+piece_types = list(resources.total_length_by_type)
+total_lengths = np.fromiter(
+    resources.total_length_by_type.values(), dtype=float, count=len(piece_types)
+)
+boards_needed = np.ceil(total_lengths / standard_length).astype(int)
+for piece_type, boards in zip(piece_types, boards_needed.tolist()):
+    lines.append(f"- {piece_type.value} boards (2.4m each): {boards}")
+
+# Write the summary in one go
+print("\n".join(lines))
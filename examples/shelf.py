@@ -1,18 +1,19 @@
 # %%
+import os
+from itertools import chain
+from typing import Iterator
+
+import numpy as np
+
 from nichiyou_daiku.core.piece import Piece, PieceType, get_shape
 from nichiyou_daiku.core.model import Model
-from nichiyou_daiku.core.anchor import Anchor
-from nichiyou_daiku.core.anchor import BoundAnchor
 from nichiyou_daiku.core.connection import Connection
-from nichiyou_daiku.core.geometry import FromMax, FromMin
-from nichiyou_daiku.core.assembly import Assembly
-from nichiyou_daiku.shell import (
-    assembly_to_build123d,
-    extract_resources,
-    generate_markdown_report,
-)
+from nichiyou_daiku.core.geometry import Face, FromMax, FromMin
 
-from ocp_vscode import show
+try:
+    from utils import connect
+except ImportError:
+    from examples.utils import connect
 
 
 def _calc_apron_length(length: float, leg_inset_length: float) -> float:
@@ -29,391 +30,212 @@ SHELF_HEIGHT = 750.0  # 72cm tall (standard dining table height)
 # Apron positioning
 BOTTOM_APRON_HEIGHT = FromMin(value=150.0)  # Distance from bottom of leg to apron
 TOP_APRON_HEIGHT = FromMax(value=250.0)  # Distance from top of leg to apron
+# Side aprons of the bottom level sit higher than its front and back aprons
+BOTTOM_SIDE_APRON_HEIGHT = FromMin(value=BOTTOM_APRON_HEIGHT.value + 150.0)
+
+# Lumber cross-sections used throughout the layout
+_2X4_SHAPE = get_shape(PieceType.PT_2x4)
+_1X4_SHAPE = get_shape(PieceType.PT_1x4)
+_2X4_HEIGHT = _2X4_SHAPE.height
+_2X4_WIDTH = _2X4_SHAPE.width
+_1X4_WIDTH = _1X4_SHAPE.width
 
 # ============================================================================
 # CREATE PIECES
 # ============================================================================
+# Pieces of one lumber type are created in batches with Piece.of_many, which
+# validates all their lengths in a single call
 
 # Four legs
-legs = {
-    pos: Piece.of(PieceType.PT_2x4, SHELF_HEIGHT, f"leg_{pos}")
-    for pos in ("left_front", "right_front", "left_back", "right_back")
-}
+leg_positions = ("left_front", "right_front", "left_back", "right_back")
+legs = dict(
+    zip(
+        leg_positions,
+        Piece.of_many(
+            PieceType.PT_2x4,
+            [SHELF_HEIGHT] * len(leg_positions),
+            (f"leg_{pos}" for pos in leg_positions),
+        ),
+    )
+)
 
 # Aprons (horizontal supports between legs)
-apron_front_back_length = _calc_apron_length(
-    SHELF_WIDTH, get_shape(PieceType.PT_2x4).height
-)
-apron_left_right_length = _calc_apron_length(
-    SHELF_DEPTH, get_shape(PieceType.PT_2x4).width
-)
+apron_front_back_length = _calc_apron_length(SHELF_WIDTH, _2X4_HEIGHT)
+apron_left_right_length = _calc_apron_length(SHELF_DEPTH, _2X4_WIDTH)
 
 # bottom aprons
-bottom_table_top_aprons = {
-    pos: Piece.of(
-        PieceType.PT_2x4, apron_front_back_length, f"bottom_table_top_apron_{pos}"
+bottom_table_top_aprons = dict(
+    zip(
+        ("front", "back"),
+        Piece.of_many(
+            PieceType.PT_2x4,
+            [apron_front_back_length] * 2,
+            ["bottom_table_top_apron_front", "bottom_table_top_apron_back"],
+        ),
     )
-    for pos in ("front", "back")
-}
+)
 
-bottom_aprons = {
-    **{
-        pos: Piece.of(PieceType.PT_2x4, apron_left_right_length, f"bottom_apron_{pos}")
-        for pos in ("left", "right")
-    },
-    "back": Piece.of(PieceType.PT_2x4, apron_front_back_length, "bottom_apron_back"),
-}
+bottom_aprons = dict(
+    zip(
+        ("left", "right", "back"),
+        Piece.of_many(
+            PieceType.PT_2x4,
+            [apron_left_right_length] * 2 + [apron_front_back_length],
+            ["bottom_apron_left", "bottom_apron_right", "bottom_apron_back"],
+        ),
+    )
+)
 
 # top aprons
-top_table_top_aprons = {
-    pos: Piece.of(
-        PieceType.PT_2x4, apron_front_back_length, f"top_table_top_apron_{pos}"
+top_table_top_aprons = dict(
+    zip(
+        ("front", "back"),
+        Piece.of_many(
+            PieceType.PT_2x4,
+            [apron_front_back_length] * 2,
+            ["top_table_top_apron_front", "top_table_top_apron_back"],
+        ),
+    )
+)
+
+top_apron_positions = ("left", "right", "front", "back")
+top_aprons = dict(
+    zip(
+        top_apron_positions,
+        Piece.of_many(
+            PieceType.PT_2x4,
+            [apron_left_right_length] * 2 + [apron_front_back_length] * 2,
+            (f"top_apron_{pos}" for pos in top_apron_positions),
+        ),
     )
-    for pos in ("front", "back")
-}
-
-top_aprons = {
-    **{
-        pos: Piece.of(PieceType.PT_2x4, apron_left_right_length, f"top_apron_{pos}")
-        for pos in ("left", "right")
-    },
-    **{
-        pos: Piece.of(PieceType.PT_2x4, apron_front_back_length, f"top_apron_{pos}")
-        for pos in ("front", "back")
-    },
-}
+)
 
 # table top parameters
 desired_table_top_piece_interval = 10.0  # Desired interval between tabletop pieces
 table_top_piece_num = (
     int(
-        (apron_front_back_length - get_shape(PieceType.PT_1x4).width)
-        / (get_shape(PieceType.PT_1x4).width + desired_table_top_piece_interval)
+        (apron_front_back_length - _1X4_WIDTH)
+        / (_1X4_WIDTH + desired_table_top_piece_interval)
     )
     + 1
 )
 table_top_piece_interval = (
-    apron_front_back_length - table_top_piece_num * get_shape(PieceType.PT_1x4).width
+    apron_front_back_length - table_top_piece_num * _1X4_WIDTH
 ) / (table_top_piece_num - 1)
 
 # tabletop pieces
-bottom_table_top_pieces = [
-    Piece.of(PieceType.PT_1x4, SHELF_DEPTH, f"bottom_table_top_{i}")
-    for i in range(table_top_piece_num)
-]
+bottom_table_top_pieces = Piece.of_many(
+    PieceType.PT_1x4,
+    [SHELF_DEPTH] * table_top_piece_num,
+    (f"bottom_table_top_{i}" for i in range(table_top_piece_num)),
+)
 
-top_table_top_pieces = [
-    Piece.of(PieceType.PT_1x4, SHELF_DEPTH, f"top_table_top_{i}")
-    for i in range(table_top_piece_num)
-]
+top_table_top_pieces = Piece.of_many(
+    PieceType.PT_1x4,
+    [SHELF_DEPTH] * table_top_piece_num,
+    (f"top_table_top_{i}" for i in range(table_top_piece_num)),
+)
 
 # ============================================================================
 # DEFINE CONNECTIONS
 # ============================================================================
-connections: list[Connection] = []
-
-
-# ----------------------------------------------------------------------------
-# Front Apron Connections (connects leg_1 and leg_2)
-# ----------------------------------------------------------------------------
-
-for leg_pos, apron_pos in [
-    ("left_front", "front"),
-    ("left_back", "back"),
-]:
-    connections.extend(
-        [
-            Connection(
-                base=BoundAnchor(
-                    piece=legs[leg_pos],
-                    anchor=Anchor(
-                        contact_face="back",
-                        edge_shared_face="left",
-                        offset=BOTTOM_APRON_HEIGHT,
-                    ),
-                ),
-                target=BoundAnchor(
-                    piece=bottom_table_top_aprons[apron_pos],
-                    anchor=Anchor(
-                        contact_face="down",
-                        edge_shared_face="right",
-                        offset=FromMin(value=0),
-                    ),
-                ),
-            ),
-            Connection(
-                base=BoundAnchor(
-                    piece=legs[leg_pos],
-                    anchor=Anchor(
-                        contact_face="back",
-                        edge_shared_face="left",
-                        offset=TOP_APRON_HEIGHT,
-                    ),
-                ),
-                target=BoundAnchor(
-                    piece=top_table_top_aprons[apron_pos],
-                    anchor=Anchor(
-                        contact_face="down",
-                        edge_shared_face="right",
-                        offset=FromMax(value=0),
-                    ),
-                ),
-            ),
-        ]
-    )
 
-for leg_pos, apron_pos in [
-    ("right_front", "front"),
-    ("right_back", "back"),
-]:
-    connections.extend(
-        [
-            Connection(
-                base=BoundAnchor(
-                    piece=legs[leg_pos],
-                    anchor=Anchor(
-                        contact_face="front",
-                        edge_shared_face="right",
-                        offset=BOTTOM_APRON_HEIGHT,
-                    ),
-                ),
-                target=BoundAnchor(
-                    piece=bottom_table_top_aprons[apron_pos],
-                    anchor=Anchor(
-                        contact_face="top",
-                        edge_shared_face="left",
-                        offset=FromMin(value=0),
-                    ),
-                ),
-            ),
-            Connection(
-                base=BoundAnchor(
-                    piece=legs[leg_pos],
-                    anchor=Anchor(
-                        contact_face="front",
-                        edge_shared_face="right",
-                        offset=TOP_APRON_HEIGHT,
-                    ),
-                ),
-                target=BoundAnchor(
-                    piece=top_table_top_aprons[apron_pos],
-                    anchor=Anchor(
-                        contact_face="top",
-                        edge_shared_face="left",
-                        offset=FromMax(value=0),
-                    ),
-                ),
-            ),
-        ]
-    )
 
-connections.extend(
-    [
-        Connection(
-            base=BoundAnchor(
-                piece=legs["left_front"],
-                anchor=Anchor(
-                    contact_face="right",
-                    edge_shared_face="front",
-                    offset=FromMin(value=BOTTOM_APRON_HEIGHT.value + 150.0),
-                ),
-            ),
-            target=BoundAnchor(
-                piece=bottom_aprons["left"],
-                anchor=Anchor(
-                    contact_face="top",
-                    edge_shared_face="front",
-                    offset=FromMax(value=0),
-                ),
-            ),
-        ),
-        Connection(
-            base=BoundAnchor(
-                piece=legs["left_front"],
-                anchor=Anchor(
-                    contact_face="right",
-                    edge_shared_face="front",
-                    offset=FromMax(value=0),
-                ),
-            ),
-            target=BoundAnchor(
-                piece=top_aprons["left"],
-                anchor=Anchor(
-                    contact_face="top",
-                    edge_shared_face="front",
-                    offset=FromMax(value=0),
-                ),
-            ),
-        ),
-        Connection(
-            base=BoundAnchor(
-                piece=legs["right_front"],
-                anchor=Anchor(
-                    contact_face="right",
-                    edge_shared_face="back",
-                    offset=FromMin(value=BOTTOM_APRON_HEIGHT.value + 150.0),
-                ),
-            ),
-            target=BoundAnchor(
-                piece=bottom_aprons["right"],
-                anchor=Anchor(
-                    contact_face="down",
-                    edge_shared_face="front",
-                    offset=FromMax(value=0),
-                ),
-            ),
-        ),
-        Connection(
-            base=BoundAnchor(
-                piece=legs["right_front"],
-                anchor=Anchor(
-                    contact_face="right",
-                    edge_shared_face="back",
-                    offset=FromMax(value=0),
-                ),
-            ),
-            target=BoundAnchor(
-                piece=top_aprons["right"],
-                anchor=Anchor(
-                    contact_face="down",
-                    edge_shared_face="front",
-                    offset=FromMax(value=0),
-                ),
-            ),
-        ),
-        Connection(
-            base=BoundAnchor(
-                piece=legs["left_back"],
-                anchor=Anchor(
-                    contact_face="back",
-                    edge_shared_face="right",
-                    offset=FromMin(value=BOTTOM_APRON_HEIGHT.value + 150.0),
-                ),
-            ),
-            target=BoundAnchor(
-                piece=bottom_aprons["back"],
-                anchor=Anchor(
-                    contact_face="down",
-                    edge_shared_face="back",
-                    offset=FromMax(value=0),
-                ),
-            ),
-        ),
-        Connection(
-            base=BoundAnchor(
-                piece=legs["left_back"],
-                anchor=Anchor(
-                    contact_face="back",
-                    edge_shared_face="right",
-                    offset=FromMax(value=0),
-                ),
-            ),
-            target=BoundAnchor(
-                piece=top_aprons["back"],
-                anchor=Anchor(
-                    contact_face="down",
-                    edge_shared_face="back",
-                    offset=FromMax(value=0),
-                ),
-            ),
-        ),
-        Connection(
-            base=BoundAnchor(
-                piece=legs["left_front"],
-                anchor=Anchor(
-                    contact_face="back",
-                    edge_shared_face="left",
-                    offset=FromMax(value=0),
-                ),
-            ),
-            target=BoundAnchor(
-                piece=top_aprons["front"],
-                anchor=Anchor(
-                    contact_face="down",
-                    edge_shared_face="front",
-                    offset=FromMax(value=0),
-                ),
-            ),
-        ),
-    ]
+# Table top aprons hang off every leg at both levels. One row per leg: leg
+# and apron position, then the contact and edge shared faces on the leg and
+# on the apron; the left and right legs only differ in these faces
+LEG_APRON_SPEC: tuple[tuple[str, str, Face, Face, Face, Face], ...] = (
+    ("left_front", "front", "back", "left", "down", "right"),
+    ("left_back", "back", "back", "left", "down", "right"),
+    ("right_front", "front", "front", "right", "top", "left"),
+    ("right_back", "back", "front", "right", "top", "left"),
 )
 
-
-# Middle pieces connect to front apron
-def _get_top_piece_offset(ind: int, piece: Piece, interval: float) -> float:
-    return ind * (get_shape(piece).width + interval)
+# One row per connection: base piece, its contact face, edge shared face and
+# offset, followed by the same for the target piece. No row is redundant:
+# each side, back and top front apron hangs off a single leg, and the rows
+# that close cycles (a table top apron between two legs, a table top piece
+# between two aprons) are real joints that get pilot holes. Placement only
+# follows a spanning tree, so those extra rows cost no positioning work.
+CONNECTION_SPEC: tuple[tuple, ...] = (
+    # Table top aprons on the legs, bottom then top level for each leg
+    *(
+        row
+        for leg_pos, apron_pos, leg_contact, leg_edge, apron_contact, apron_edge
+        in LEG_APRON_SPEC
+        for row in (
+            (legs[leg_pos], leg_contact, leg_edge, BOTTOM_APRON_HEIGHT,
+             bottom_table_top_aprons[apron_pos], apron_contact, apron_edge,
+             FromMin.ZERO),
+            (legs[leg_pos], leg_contact, leg_edge, TOP_APRON_HEIGHT,
+             top_table_top_aprons[apron_pos], apron_contact, apron_edge,
+             FromMax.ZERO),
+        )
+    ),
+    # Side and back aprons
+    (legs["left_front"], "right", "front", BOTTOM_SIDE_APRON_HEIGHT,
+     bottom_aprons["left"], "top", "front", FromMax.ZERO),
+    (legs["left_front"], "right", "front", FromMax.ZERO,
+     top_aprons["left"], "top", "front", FromMax.ZERO),
+    (legs["right_front"], "right", "back", BOTTOM_SIDE_APRON_HEIGHT,
+     bottom_aprons["right"], "down", "front", FromMax.ZERO),
+    (legs["right_front"], "right", "back", FromMax.ZERO,
+     top_aprons["right"], "down", "front", FromMax.ZERO),
+    (legs["left_back"], "back", "right", BOTTOM_SIDE_APRON_HEIGHT,
+     bottom_aprons["back"], "down", "back", FromMax.ZERO),
+    (legs["left_back"], "back", "right", FromMax.ZERO,
+     top_aprons["back"], "down", "back", FromMax.ZERO),
+    (legs["left_front"], "back", "left", FromMax.ZERO,
+     top_aprons["front"], "down", "front", FromMax.ZERO),
+)  # fmt: skip
+
+
+# Offsets of the table top pieces along the aprons. Each piece sits at the
+# same offset on the front and the back apron, and both levels use the same
+# layout, so the offsets are computed once and shared by all four aprons
+table_top_apron_offsets = [
+    FromMin(value=offset)
+    for offset in (
+        np.arange(table_top_piece_num) * (_1X4_WIDTH + table_top_piece_interval)
+    ).tolist()
+]
 
 
+# Middle pieces connect to front apron
 def _connect_top_pieces(
-    top_pieces: list[Piece], front_apron: Piece, back_apron: Piece, offset: float
-) -> list[Connection]:
-    return [
-        *[
-            Connection(
-                base=BoundAnchor(
-                    piece=front_apron,
-                    anchor=Anchor(
-                        contact_face="back",
-                        edge_shared_face="right",
-                        offset=FromMin(
-                            value=_get_top_piece_offset(i, top_piece, offset)
-                        ),
-                    ),
-                ),
-                target=BoundAnchor(
-                    piece=top_piece,
-                    anchor=Anchor(
-                        contact_face="back",
-                        edge_shared_face="top",
-                        offset=FromMin(value=0),
-                    ),
-                ),
-            )
-            for i, top_piece in enumerate(top_pieces)
-        ],
-        *[
-            Connection(
-                base=BoundAnchor(
-                    piece=back_apron,
-                    anchor=Anchor(
-                        contact_face="back",
-                        edge_shared_face="left",
-                        offset=FromMin(
-                            value=_get_top_piece_offset(
-                                i, top_piece, table_top_piece_interval
-                            )
-                        ),
-                    ),
-                ),
-                target=BoundAnchor(
-                    piece=top_piece,
-                    anchor=Anchor(
-                        contact_face="back",
-                        edge_shared_face="down",
-                        offset=FromMin(value=0),
-                    ),
-                ),
-            )
-            for i, top_piece in enumerate(top_pieces)
-        ],
-    ]
-
-
-connections.extend(
-    _connect_top_pieces(
-        bottom_table_top_pieces,
-        bottom_table_top_aprons["front"],
-        bottom_table_top_aprons["back"],
-        table_top_piece_interval,
-    )
-)
-
-connections.extend(
-    _connect_top_pieces(
-        top_table_top_pieces,
-        top_table_top_aprons["front"],
-        top_table_top_aprons["back"],
-        table_top_piece_interval,
+    top_pieces: list[Piece],
+    front_apron: Piece,
+    back_apron: Piece,
+    apron_offsets: list[FromMin],
+) -> Iterator[Connection]:
+    for top_piece, apron_offset in zip(top_pieces, apron_offsets):
+        yield connect(
+            front_apron, "back", "right", apron_offset,
+            top_piece, "back", "top", FromMin.ZERO,
+        )  # fmt: skip
+    for top_piece, apron_offset in zip(top_pieces, apron_offsets):
+        yield connect(
+            back_apron, "back", "left", apron_offset,
+            top_piece, "back", "down", FromMin.ZERO,
+        )  # fmt: skip
+
+
+# All connections are chained lazily and materialized once, in one list
+connections: list[Connection] = list(
+    chain(
+        (connect(*row) for row in CONNECTION_SPEC),
+        _connect_top_pieces(
+            bottom_table_top_pieces,
+            bottom_table_top_aprons["front"],
+            bottom_table_top_aprons["back"],
+            table_top_apron_offsets,
+        ),
+        _connect_top_pieces(
+            top_table_top_pieces,
+            top_table_top_aprons["front"],
+            top_table_top_aprons["back"],
+            table_top_apron_offsets,
+        ),
     )
 )
 
@@ -435,60 +257,71 @@ model = Model.of(
     label="shelf",
 )
 
-# ============================================================================
-# CREATE ASSEMBLY AND EXTRACT RESOURCES
-# ============================================================================
-print("Creating assembly...")
-assembly = Assembly.of(model)
-
-print("Extracting bill of materials...")
-resources = extract_resources(assembly)
-
-# Display resource summary
-print("\n" + resources.pretty_print())
-
-# Export to JSON
-json_data = resources.model_dump_json(indent=2)
-print("\nJSON Export (first 500 chars):")
-print(json_data[:500] + "..." if len(json_data) > 500 else json_data)
-
-# Generate comprehensive markdown report
-print("\nGenerating detailed markdown report...")
-
-# Define custom standard lengths for this project
-custom_standard_lengths = {
-    PieceType.PT_2x4: [2440.0, 3000.0, 3600.0],  # 8ft, ~10ft, 12ft
-    PieceType.PT_1x4: [1800.0, 2400.0, 3000.0],  # 6ft, 8ft, 10ft
-}
-
-report = generate_markdown_report(
-    resources,
-    project_name="DIY Shelf Project",
-    standard_lengths=custom_standard_lengths,
-    include_cut_diagram=True,
-)
+# The build pipeline below only runs when executed as a script, so importing
+# this module for its model does not solve the assembly or build the 3D parts
+if __name__ == "__main__":
+    from nichiyou_daiku.core.assembly import Assembly
+    from nichiyou_daiku.shell import extract_resources, generate_markdown_report
+
+    # ============================================================================
+    # CREATE ASSEMBLY AND EXTRACT RESOURCES
+    # ============================================================================
+    print("Creating assembly...")
+    assembly = Assembly.of(model)
+
+    print("Extracting bill of materials...")
+    resources = extract_resources(assembly)
+
+    # Display resource summary
+    print("\n" + resources.pretty_print())
+
+    # Preview the JSON export; only the leading pieces are serialized
+    print("\nJSON Export (first 500 chars):")
+    print(resources.preview_json(500))
+
+    # Generate comprehensive markdown report
+    print("\nGenerating detailed markdown report...")
+
+    # Define custom standard lengths for this project
+    custom_standard_lengths = {
+        PieceType.PT_2x4: [2440.0, 3000.0, 3600.0],  # 8ft, ~10ft, 12ft
+        PieceType.PT_1x4: [1800.0, 2400.0, 3000.0],  # 6ft, 8ft, 10ft
+    }
+
+    report = generate_markdown_report(
+        resources,
+        project_name="DIY Shelf Project",
+        standard_lengths=custom_standard_lengths,
+        include_cut_diagram=True,
+    )
 
-# Print report preview (not saving to file to avoid generated artifacts)
-print("✅ Report generated successfully")
-print("📋 Report includes cut optimization and purchase recommendations")
+    # Print report preview (not saving to file to avoid generated artifacts)
+    print("✅ Report generated successfully")
+    print("📋 Report includes cut optimization and purchase recommendations")
 
-# Show a preview of the report
-print("\n" + "=" * 60)
-print("REPORT PREVIEW:")
-print("=" * 60)
-print(report[:800] + "\n..." if len(report) > 800 else report)
+    # Show a preview of the report
+    print("\n" + "=" * 60)
+    print("REPORT PREVIEW:")
+    print("=" * 60)
+    print(report[:800] + "\n..." if len(report) > 800 else report)
 
-# ============================================================================
-# VISUALIZE
-# ============================================================================
-print("\n\nBuilding 3D visualization...")
+    # ============================================================================
+    # VISUALIZE
+    # ============================================================================
+    # Set SHELF_VIS=0 to stop after the report; the 3D stack (build123d,
+    # OpenCascade and the viewer) is then never imported
+    if os.environ.get("SHELF_VIS", "1") != "0":
+        from nichiyou_daiku.shell import assembly_to_build123d
+        from ocp_vscode import show
+
+        print("\n\nBuilding 3D visualization...")
 
-# Export with smaller fillet radius for sharper edges
-compound = assembly_to_build123d(assembly, fillet_radius=2.0)
+        # Export with smaller fillet radius for sharper edges
+        compound = assembly_to_build123d(assembly, fillet_radius=2.0)
 
-# Display the result
-show(compound)
+        # Display the result
+        show(compound)
 
-print("\nShelf assembly complete!")
-print(f"Shelf dimensions: {SHELF_WIDTH}mm x {SHELF_DEPTH}mm x {SHELF_HEIGHT}mm")
-print(f"Using {len(model.pieces)} pieces with {len(model.connections)} connections")
+    print("\nShelf assembly complete!")
+    print(f"Shelf dimensions: {SHELF_WIDTH}mm x {SHELF_DEPTH}mm x {SHELF_HEIGHT}mm")
+    print(f"Using {len(model.pieces)} pieces with {len(model.connections)} connections")
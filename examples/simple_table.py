@@ -7,14 +7,13 @@ traditional table construction.
 
 from nichiyou_daiku.core.piece import Piece, PieceType, get_shape
 from nichiyou_daiku.core.model import Model
-from nichiyou_daiku.core.anchor import Anchor
-from nichiyou_daiku.core.anchor import BoundAnchor
 from nichiyou_daiku.core.connection import Connection
 from nichiyou_daiku.core.geometry import FromMax, FromMin
-from nichiyou_daiku.core.assembly import Assembly
-from nichiyou_daiku.shell import assembly_to_build123d
 
-from ocp_vscode import show
+try:
+    from utils import connect
+except ImportError:
+    from examples.utils import connect
 
 
 # ============================================================================
@@ -25,8 +24,9 @@ TABLE_DEPTH = 600.0  # 60cm deep
 TABLE_HEIGHT = 720.0  # 72cm tall (standard dining table height)
 
 # Calculate insets based on lumber dimensions
-LEG_INSET_DEPTH = get_shape(PieceType.PT_2x4).height
-LEG_INSET_WIDTH = get_shape(PieceType.PT_2x4).width
+_2X4_SHAPE = get_shape(PieceType.PT_2x4)
+LEG_INSET_DEPTH = _2X4_SHAPE.height
+LEG_INSET_WIDTH = _2X4_SHAPE.width
 
 # Apron positioning
 APRON_HEIGHT = 100.0  # Distance from top of leg to apron
@@ -34,254 +34,112 @@ APRON_HEIGHT = 100.0  # Distance from top of leg to apron
 # ============================================================================
 # CREATE PIECES
 # ============================================================================
+# All pieces are 2x4s, created in batches with Piece.of_many, which validates
+# all their lengths in a single call
 
 # Four legs
-leg_1 = Piece.of(PieceType.PT_2x4, TABLE_HEIGHT, "leg_1")
-leg_2 = Piece.of(PieceType.PT_2x4, TABLE_HEIGHT, "leg_2")
-leg_3 = Piece.of(PieceType.PT_2x4, TABLE_HEIGHT, "leg_3")
-leg_4 = Piece.of(PieceType.PT_2x4, TABLE_HEIGHT, "leg_4")
+leg_1, leg_2, leg_3, leg_4 = Piece.of_many(
+    PieceType.PT_2x4, [TABLE_HEIGHT] * 4, ["leg_1", "leg_2", "leg_3", "leg_4"]
+)
 
 # Aprons (horizontal supports between legs)
 apron_front_back_length = TABLE_WIDTH - 2 * LEG_INSET_WIDTH
 apron_left_right_length = TABLE_DEPTH - 2 * LEG_INSET_DEPTH
 
-apron_front = Piece.of(PieceType.PT_2x4, apron_front_back_length, "apron_front")
-apron_back = Piece.of(PieceType.PT_2x4, apron_front_back_length, "apron_back")
-apron_left = Piece.of(PieceType.PT_2x4, apron_left_right_length, "apron_left")
-apron_right = Piece.of(PieceType.PT_2x4, apron_left_right_length, "apron_right")
+apron_front, apron_back, apron_left, apron_right = Piece.of_many(
+    PieceType.PT_2x4,
+    [apron_front_back_length] * 2 + [apron_left_right_length] * 2,
+    ["apron_front", "apron_back", "apron_left", "apron_right"],
+)
 
 # Tabletop pieces
 table_top_piece_num = 6
 table_top_piece_interval = (
-    apron_front_back_length - table_top_piece_num * get_shape(PieceType.PT_2x4).width
+    apron_front_back_length - table_top_piece_num * _2X4_SHAPE.width
 ) / (table_top_piece_num + 1)
-table_top_pieces = [
-    Piece.of(PieceType.PT_2x4, TABLE_DEPTH, f"table_top_{i + 1}")
-    for i in range(table_top_piece_num + 2)
-]
+table_top_pieces = Piece.of_many(
+    PieceType.PT_2x4,
+    [TABLE_DEPTH] * (table_top_piece_num + 2),
+    (f"table_top_{i + 1}" for i in range(table_top_piece_num + 2)),
+)
+
 
 # ============================================================================
 # DEFINE CONNECTIONS
 # ============================================================================
-connections = []
-
-# ----------------------------------------------------------------------------
-# Front Apron Connections (connects leg_1 and leg_2)
-# ----------------------------------------------------------------------------
-connections.append(
-    Connection(
-        base=BoundAnchor(
-            piece=leg_1,
-            anchor=Anchor(
-                contact_face="left", edge_shared_face="back", offset=FromMax(value=0)
-            ),
-        ),
-        target=BoundAnchor(
-            piece=apron_front,
-            anchor=Anchor(
-                contact_face="down", edge_shared_face="back", offset=FromMax(value=0)
-            ),
-        ),
-    )
-)
-
-connections.append(
-    Connection(
-        base=BoundAnchor(
-            piece=apron_front,
-            anchor=Anchor(
-                contact_face="top", edge_shared_face="front", offset=FromMax(value=0)
-            ),
-        ),
-        target=BoundAnchor(
-            piece=leg_2,
-            anchor=Anchor(
-                contact_face="right", edge_shared_face="front", offset=FromMax(value=0)
-            ),
-        ),
-    )
-)
-
-# ----------------------------------------------------------------------------
-# Back Apron Connections (connects leg_3 and leg_4)
-# ----------------------------------------------------------------------------
-connections.append(
-    Connection(
-        base=BoundAnchor(
-            piece=leg_3,
-            anchor=Anchor(
-                contact_face="left", edge_shared_face="back", offset=FromMax(value=0)
-            ),
-        ),
-        target=BoundAnchor(
-            piece=apron_back,
-            anchor=Anchor(
-                contact_face="down", edge_shared_face="back", offset=FromMax(value=0)
-            ),
-        ),
-    )
-)
-
-connections.append(
-    Connection(
-        base=BoundAnchor(
-            piece=leg_4,
-            anchor=Anchor(
-                contact_face="right", edge_shared_face="front", offset=FromMax(value=0)
-            ),
-        ),
-        target=BoundAnchor(
-            piece=apron_back,
-            anchor=Anchor(
-                contact_face="top", edge_shared_face="front", offset=FromMax(value=0)
-            ),
-        ),
-    )
-)
-
-# ----------------------------------------------------------------------------
-# Left Apron Connections (connects leg_1 and leg_3)
-# ----------------------------------------------------------------------------
-connections.append(
-    Connection(
-        base=BoundAnchor(
-            piece=leg_1,
-            anchor=Anchor(
-                contact_face="back",
-                edge_shared_face="right",
-                offset=FromMin(value=APRON_HEIGHT),
-            ),
-        ),
-        target=BoundAnchor(
-            piece=apron_left,
-            anchor=Anchor(
-                contact_face="down", edge_shared_face="back", offset=FromMin(value=0)
-            ),
-        ),
-    )
-)
 
-connections.append(
-    Connection(
-        base=BoundAnchor(
-            piece=leg_3,
-            anchor=Anchor(
-                contact_face="front",
-                edge_shared_face="right",
-                offset=FromMin(value=APRON_HEIGHT),
-            ),
-        ),
-        target=BoundAnchor(
-            piece=apron_left,
-            anchor=Anchor(
-                contact_face="top", edge_shared_face="back", offset=FromMin(value=0)
-            ),
-        ),
-    )
-)
 
-# ----------------------------------------------------------------------------
-# Right Apron Connections (connects leg_2 and leg_4)
-# ----------------------------------------------------------------------------
-connections.append(
-    Connection(
-        base=BoundAnchor(
-            piece=leg_2,
-            anchor=Anchor(
-                contact_face="back",
-                edge_shared_face="left",
-                offset=FromMin(value=APRON_HEIGHT),
-            ),
-        ),
-        target=BoundAnchor(
-            piece=apron_right,
-            anchor=Anchor(
-                contact_face="down", edge_shared_face="front", offset=FromMin(value=0)
-            ),
-        ),
-    )
-)
+# Offset of the side aprons along the legs
+APRON_OFFSET = FromMin(value=APRON_HEIGHT)
 
-connections.append(
-    Connection(
-        base=BoundAnchor(
-            piece=leg_4,
-            anchor=Anchor(
-                contact_face="front",
-                edge_shared_face="left",
-                offset=FromMin(value=APRON_HEIGHT),
-            ),
-        ),
-        target=BoundAnchor(
-            piece=apron_right,
-            anchor=Anchor(
-                contact_face="top", edge_shared_face="front", offset=FromMin(value=0)
-            ),
-        ),
-    )
-)
-
-# ----------------------------------------------------------------------------
-# Tabletop Connections
-# ----------------------------------------------------------------------------
-
-# Edge pieces connect to legs
-connections.append(
-    Connection(
-        base=BoundAnchor(
-            piece=table_top_pieces[0],
-            anchor=Anchor(
-                contact_face="back", edge_shared_face="down", offset=FromMin(value=0)
-            ),
-        ),
-        target=BoundAnchor(
-            piece=leg_1,
-            anchor=Anchor(
-                contact_face="top", edge_shared_face="front", offset=FromMin(value=0)
-            ),
-        ),
-    )
-)
+# Offsets of the middle table top pieces along the front apron
+table_top_offsets = [
+    FromMin(value=(i - 1) * LEG_INSET_WIDTH + i * table_top_piece_interval)
+    for i in range(1, table_top_piece_num + 1)
+]
 
-connections.append(
-    Connection(
-        base=BoundAnchor(
-            piece=table_top_pieces[-1],
-            anchor=Anchor(
-                contact_face="back", edge_shared_face="down", offset=FromMin(value=0)
-            ),
-        ),
-        target=BoundAnchor(
-            piece=leg_2,
-            anchor=Anchor(
-                contact_face="top", edge_shared_face="front", offset=FromMin(value=0)
-            ),
-        ),
-    )
+# One row per connection: the base anchor, then the target anchor, each given
+# as piece, contact face, edge shared face and offset
+CONNECTION_SPEC: tuple[tuple[tuple, tuple], ...] = (
+    # Front apron (connects leg_1 and leg_2)
+    (
+        (leg_1, "left", "back", FromMax.ZERO),
+        (apron_front, "down", "back", FromMax.ZERO),
+    ),
+    (
+        (apron_front, "top", "front", FromMax.ZERO),
+        (leg_2, "right", "front", FromMax.ZERO),
+    ),
+    # Back apron (connects leg_3 and leg_4)
+    (
+        (leg_3, "left", "back", FromMax.ZERO),
+        (apron_back, "down", "back", FromMax.ZERO),
+    ),
+    (
+        (leg_4, "right", "front", FromMax.ZERO),
+        (apron_back, "top", "front", FromMax.ZERO),
+    ),
+    # Left apron (connects leg_1 and leg_3)
+    (
+        (leg_1, "back", "right", APRON_OFFSET),
+        (apron_left, "down", "back", FromMin.ZERO),
+    ),
+    (
+        (leg_3, "front", "right", APRON_OFFSET),
+        (apron_left, "top", "back", FromMin.ZERO),
+    ),
+    # Right apron (connects leg_2 and leg_4)
+    (
+        (leg_2, "back", "left", APRON_OFFSET),
+        (apron_right, "down", "front", FromMin.ZERO),
+    ),
+    (
+        (leg_4, "front", "left", APRON_OFFSET),
+        (apron_right, "top", "front", FromMin.ZERO),
+    ),
+    # Edge table top pieces connect to legs
+    (
+        (table_top_pieces[0], "back", "down", FromMin.ZERO),
+        (leg_1, "top", "front", FromMin.ZERO),
+    ),
+    (
+        (table_top_pieces[-1], "back", "down", FromMin.ZERO),
+        (leg_2, "top", "front", FromMin.ZERO),
+    ),
+    # Middle table top pieces connect to front apron
+    *(
+        (
+            (apron_front, "right", "front", offset),
+            (piece, "back", "top", FromMin.ZERO),
+        )
+        for piece, offset in zip(table_top_pieces[1:-1], table_top_offsets)
+    ),
 )
 
-# Middle pieces connect to front apron
-for i in range(1, table_top_piece_num + 1):
-    connections.append(
-        Connection(
-            base=BoundAnchor(
-                piece=apron_front,
-                anchor=Anchor(
-                    contact_face="right",
-                    edge_shared_face="front",
-                    offset=FromMin(
-                        value=(i - 1) * LEG_INSET_WIDTH + i * table_top_piece_interval
-                    ),
-                ),
-            ),
-            target=BoundAnchor(
-                piece=table_top_pieces[i],
-                anchor=Anchor(
-                    contact_face="back", edge_shared_face="top", offset=FromMin(value=0)
-                ),
-            ),
-        )
-    )
+# All connections are built from the table in one pass
+connections: list[Connection] = [
+    connect(*base, *target) for base, target in CONNECTION_SPEC
+]
 
 
 # ============================================================================
@@ -306,17 +164,24 @@ model = Model.of(
 # ============================================================================
 # VISUALIZE
 # ============================================================================
-print("Building simple table...")
-assembly = Assembly.of(model)
-
-# Export with smaller fillet radius for sharper edges
-compound = assembly_to_build123d(assembly, fillet_radius=2.0)
-
-# Display the result
-show(compound)
-
-print("\nSimple table assembly complete!")
-print(f"Table frame dimensions: {TABLE_WIDTH}mm x {TABLE_DEPTH}mm")
-print(f"Table height: {TABLE_HEIGHT}mm")
-print(f"Using {len(model.pieces)} pieces with {len(model.connections)} connections")
-print("\nNote: The tabletop would be added on top of this frame structure.")
+# The 3D conversion and the viewer pull in OpenCascade, so they only run when
+# executed as a script; importing this module just builds the model
+if __name__ == "__main__":
+    from nichiyou_daiku.core.assembly import Assembly
+    from nichiyou_daiku.shell import assembly_to_build123d
+    from ocp_vscode import show
+
+    print("Building simple table...")
+    assembly = Assembly.of(model)
+
+    # Export with smaller fillet radius for sharper edges
+    compound = assembly_to_build123d(assembly, fillet_radius=2.0)
+
+    # Display the result
+    show(compound)
+
+    print("\nSimple table assembly complete!")
+    print(f"Table frame dimensions: {TABLE_WIDTH}mm x {TABLE_DEPTH}mm")
+    print(f"Table height: {TABLE_HEIGHT}mm")
+    print(f"Using {len(model.pieces)} pieces with {len(model.connections)} connections")
+    print("\nNote: The tabletop would be added on top of this frame structure.")
@@ -9,7 +9,7 @@ from nichiyou_daiku.core.model import Model
 from nichiyou_daiku.core.anchor import Anchor
 from nichiyou_daiku.core.anchor import BoundAnchor
 from nichiyou_daiku.core.connection import Connection
-from nichiyou_daiku.core.geometry import FromMax, FromMin
+from nichiyou_daiku.core.geometry import Face, FromMax, FromMin, Offset
 from nichiyou_daiku.core.assembly import Assembly
 
 
@@ -40,51 +40,50 @@ def create_grid_frame(
         >>> grid = create_grid_frame(3, 3, 200.0, 200.0)
         >>> assembly = Assembly.of(grid)
     """
-    pieces = []
-    connections = []
+    # Pieces and connections are built in one pass each and handed to
+    # Model.of together, which indexes them in a single batch
+    horizontals = Piece.of_many(
+        piece_type,
+        [cols * cell_width] * (rows + 1),
+        (f"horizontal_{row}" for row in range(rows + 1)),
+    )
+    verticals = Piece.of_many(
+        piece_type,
+        [rows * cell_height] * (cols + 1),
+        (f"vertical_{col}" for col in range(cols + 1)),
+    )
 
-    # Create horizontal pieces (rows)
-    for row in range(rows + 1):
-        piece_id = f"horizontal_{row}"
-        length = cols * cell_width
-        piece = Piece.of(piece_type, length, piece_id)
-        pieces.append(piece)
-
-    # Create vertical pieces (columns)
-    for col in range(cols + 1):
-        piece_id = f"vertical_{col}"
-        length = rows * cell_height
-        piece = Piece.of(piece_type, length, piece_id)
-        pieces.append(piece)
-
-    # Connect pieces at intersections
-    for row in range(rows + 1):
-        for col in range(cols + 1):
-            horizontal = pieces[row]  # horizontal pieces are first in list
-            vertical = pieces[(rows + 1) + col]  # vertical pieces follow
-
-            # Connect vertical piece to horizontal piece
-            connections.append(
-                Connection(
-                    base=BoundAnchor(
-                        piece=horizontal,
-                        anchor=Anchor(
-                            contact_face="front",
-                            edge_shared_face="top",
-                            offset=FromMax(value=col * cell_width),
-                        ),
-                    ),
-                    target=BoundAnchor(
-                        piece=vertical,
-                        anchor=Anchor(
-                            contact_face="down",
-                            edge_shared_face="front",
-                            offset=FromMin(value=row * cell_height),
-                        ),
-                    ),
-                )
-            )
+    # The anchor on a horizontal only depends on the column and the one on a
+    # vertical only on the row, so each is built once per axis and shared by
+    # every intersection along it
+    column_anchors = [
+        Anchor(
+            contact_face="front",
+            edge_shared_face="top",
+            offset=FromMax(value=col * cell_width),
+        )
+        for col in range(cols + 1)
+    ]
+    row_anchors = [
+        Anchor(
+            contact_face="down",
+            edge_shared_face="front",
+            offset=FromMin(value=row * cell_height),
+        )
+        for row in range(rows + 1)
+    ]
+
+    # Connect vertical piece to horizontal piece at every intersection
+    connections = [
+        Connection(
+            base=BoundAnchor(piece=horizontal, anchor=column_anchor),
+            target=BoundAnchor(piece=vertical, anchor=row_anchor),
+        )
+        for horizontal, row_anchor in zip(horizontals, row_anchors)
+        for vertical, column_anchor in zip(verticals, column_anchors)
+    ]
 
+    pieces = horizontals + verticals
     return Model.of(pieces=pieces, connections=connections)
 
 
@@ -151,7 +150,7 @@ def create_box_frame(
                 anchor=Anchor(
                     contact_face="front",
                     edge_shared_face="top",
-                    offset=FromMax(value=0.0),
+                    offset=FromMax.ZERO,
                 ),
             ),
             target=BoundAnchor(
@@ -159,7 +158,7 @@ def create_box_frame(
                 anchor=Anchor(
                     contact_face="left",
                     edge_shared_face="top",
-                    offset=FromMin(value=0.0),
+                    offset=FromMin.ZERO,
                 ),
             ),
         )
@@ -172,7 +171,7 @@ def create_box_frame(
                 anchor=Anchor(
                     contact_face="left",
                     edge_shared_face="top",
-                    offset=FromMax(value=0.0),
+                    offset=FromMax.ZERO,
                 ),
             ),
             target=BoundAnchor(
@@ -180,7 +179,7 @@ def create_box_frame(
                 anchor=Anchor(
                     contact_face="front",
                     edge_shared_face="top",
-                    offset=FromMin(value=0.0),
+                    offset=FromMin.ZERO,
                 ),
             ),
         )
@@ -277,3 +276,61 @@ def get_connection_summary(model: Model) -> str:
         lines.append("")
 
     return "\n".join(lines)
+
+
+def connect(
+    base: Piece,
+    base_contact_face: Face,
+    base_edge_shared_face: Face,
+    base_offset: Offset,
+    target: Piece,
+    target_contact_face: Face,
+    target_edge_shared_face: Face,
+    target_offset: Offset,
+) -> Connection:
+    """Create a connection from the anchor parameters of both pieces.
+
+    The flat argument order matches one row of a connection table, so a
+    whole table can be built with ``[connect(*row) for row in table]``.
+
+    Args:
+        base: Piece the target is attached to
+        base_contact_face: Face of the base touching the target
+        base_edge_shared_face: Face of the base sharing the anchor edge
+        base_offset: Offset of the anchor along that edge of the base
+        target: Piece being attached
+        target_contact_face: Face of the target touching the base
+        target_edge_shared_face: Face of the target sharing the anchor edge
+        target_offset: Offset of the anchor along that edge of the target
+
+    Returns:
+        Connection between the two anchors
+
+    Example:
+        >>> leg = Piece.of(PieceType.PT_2x4, 720.0, "leg")
+        >>> apron = Piece.of(PieceType.PT_2x4, 500.0, "apron")
+        >>> conn = connect(
+        ...     leg, "left", "back", FromMax(value=0),
+        ...     apron, "down", "back", FromMax(value=0),
+        ... )
+        >>> conn.base.piece.id, conn.target.anchor.contact_face
+        ('leg', 'down')
+    """
+    return Connection(
+        base=BoundAnchor(
+            piece=base,
+            anchor=Anchor(
+                contact_face=base_contact_face,
+                edge_shared_face=base_edge_shared_face,
+                offset=base_offset,
+            ),
+        ),
+        target=BoundAnchor(
+            piece=target,
+            anchor=Anchor(
+                contact_face=target_contact_face,
+                edge_shared_face=target_edge_shared_face,
+                offset=target_offset,
+            ),
+        ),
+    )
@@ -17,34 +17,51 @@ from nichiyou_daiku.cli.utils import (
 )
 
 
-def project_to_2d(part, viewport_origin, viewport_up, page_origin, scale_factor=1.0):
-    """Project 3D part to 2D view on page.
+def project_to_2d(part, viewport_origin, viewport_up):
+    """Project 3D part to 2D view.
 
-    Helper function from build123d tutorial to generate 2D views
-    translated on the 2D page.
+    Helper function from build123d tutorial to generate 2D views. The views
+    are projected at the page origin (0, 0) and positioned by place_on_page.
 
     Args:
         part: 3D object (Compound)
         viewport_origin: Location of viewport (tuple of 3 floats)
         viewport_up: Direction of viewport Y axis (tuple of 3 floats)
-        page_origin: Center of 2D object on page (tuple of 3 floats)
-        scale_factor: Part scalar (default: 1.0)
 
     Returns:
         tuple[ShapeList[Edge], ShapeList[Edge]]: visible & hidden edges
     """
-    from build123d import scale as bd_scale, Pos, ShapeList
+    from build123d import ShapeList
 
-    scaled_part = part if scale_factor == 1.0 else bd_scale(part, scale_factor)
-    visible, hidden = scaled_part.project_to_viewport(
+    visible, hidden = part.project_to_viewport(
         viewport_origin, viewport_up, look_at=(0, 0, 0)
     )
-    visible = [Pos(*page_origin) * e for e in visible]
-    hidden = [Pos(*page_origin) * e for e in hidden]
 
     return ShapeList(visible), ShapeList(hidden)
 
 
+def place_on_page(edges, page_origin, scale_factor=1.0):
+    """Scale projected edges about the origin and move them on the page.
+
+    The edges are gathered into one compound, so the scale and the move are
+    each applied once for the whole view instead of once per edge.
+
+    Args:
+        edges: 2D edges projected at the page origin (0, 0)
+        page_origin: Center of 2D object on page (tuple of 2 or 3 floats)
+        scale_factor: Edge scalar (default: 1.0)
+
+    Returns:
+        Compound: edges placed on the page
+    """
+    from build123d import Compound, Pos
+
+    view = Compound(children=list(edges))
+    if scale_factor != 1.0:
+        view = view.scale(scale_factor)
+    return Pos(*page_origin) * view
+
+
 @click.command()
 @click.argument("input_file", type=click.Path(exists=True, path_type=Path))
 @click.option(
@@ -180,74 +197,36 @@ def drawing(
         grid_width = drawing_area_width / 2 - margin
         grid_height = drawing_area_height / 2 - margin
 
-        # Step 1: Project all views at origin to get their bounding boxes
-        # This determines the actual size of each view
-        top_vis_temp, top_hid_temp = project_to_2d(
-            compound, (0, 0, 100), (0, 1, 0), (0, 0), 1.0
-        )
-        front_vis_temp, front_hid_temp = project_to_2d(
-            compound, (0, -100, 0), (0, 0, 1), (0, 0), 1.0
-        )
-        side_vis_temp, side_hid_temp = project_to_2d(
-            compound, (100, 0, 0), (0, 0, 1), (0, 0), 1.0
-        )
-        iso_vis_temp, iso_hid_temp = project_to_2d(
-            compound, (100, 100, 100), (0, 0, 1), (0, 0), 1.0
-        )
+        # Viewport origin and up direction of each view
+        views = {
+            "top": ((0, 0, 100), (0, 1, 0)),
+            "front": ((0, -100, 0), (0, 0, 1)),
+            "side": ((100, 0, 0), (0, 0, 1)),
+            "iso": ((100, 100, 100), (0, 0, 1)),
+        }
 
-        # Get bounding boxes
-        top_bbox = Build123dCompound(
-            children=top_vis_temp + top_hid_temp
-        ).bounding_box()
-        front_bbox = Build123dCompound(
-            children=front_vis_temp + front_hid_temp
-        ).bounding_box()
-        side_bbox = Build123dCompound(
-            children=side_vis_temp + side_hid_temp
-        ).bounding_box()
-        iso_bbox = Build123dCompound(
-            children=iso_vis_temp + iso_hid_temp
-        ).bounding_box()
+        # Step 1: Project all views once at origin to get their bounding boxes.
+        # The projection is orthographic and looks at the origin, so scaling
+        # and moving these edges later gives the same result as projecting a
+        # scaled part at its page position, without re-running hidden line
+        # removal for every layout step
+        projections = {
+            name: project_to_2d(compound, viewport_origin, viewport_up)
+            for name, (viewport_origin, viewport_up) in views.items()
+        }
+        bboxes = {
+            name: Build123dCompound(children=vis + hid).bounding_box()
+            for name, (vis, hid) in projections.items()
+        }
 
         # Step 2: Calculate unified scale based on largest view
-        top_max = max(top_bbox.size.X, top_bbox.size.Y)
-        front_max = max(front_bbox.size.X, front_bbox.size.Y)
-        side_max = max(side_bbox.size.X, side_bbox.size.Y)
-        iso_max = max(iso_bbox.size.X, iso_bbox.size.Y)
-        largest_view = max(top_max, front_max, side_max, iso_max)
+        largest_view = max(max(bbox.size.X, bbox.size.Y) for bbox in bboxes.values())
 
         # Views should fit in 70% of grid cell (leaving margin)
         max_view_size = min(grid_width, grid_height) * 0.7
         view_scale = max_view_size / largest_view if largest_view > 0 else 1.0
 
-        # Step 3: Re-project with calculated scale to get final bounding boxes
-        top_vis_temp, top_hid_temp = project_to_2d(
-            compound, (0, 0, 100), (0, 1, 0), (0, 0), view_scale
-        )
-        front_vis_temp, front_hid_temp = project_to_2d(
-            compound, (0, -100, 0), (0, 0, 1), (0, 0), view_scale
-        )
-        side_vis_temp, side_hid_temp = project_to_2d(
-            compound, (100, 0, 0), (0, 0, 1), (0, 0), view_scale
-        )
-        iso_vis_temp, iso_hid_temp = project_to_2d(
-            compound, (100, 100, 100), (0, 0, 1), (0, 0), view_scale
-        )
-
-        top_bbox = Build123dCompound(
-            children=top_vis_temp + top_hid_temp
-        ).bounding_box()
-        front_bbox = Build123dCompound(
-            children=front_vis_temp + front_hid_temp
-        ).bounding_box()
-        side_bbox = Build123dCompound(
-            children=side_vis_temp + side_hid_temp
-        ).bounding_box()
-        iso_bbox = Build123dCompound(
-            children=iso_vis_temp + iso_hid_temp
-        ).bounding_box()
-
-        # Step 4: Calculate grid cell centers
+        # Step 3: Calculate grid cell centers
         y_offset = 10  # Offset Y slightly up to account for title block
 
         left_x_center = -drawing_area_width / 4
@@ -255,43 +234,24 @@ def drawing(
         top_y_center = drawing_area_height / 4 + y_offset
         bottom_y_center = -drawing_area_height / 4 + y_offset
 
-        # Step 5: Calculate final positions (bbox center at grid center)
-        top_x = left_x_center - top_bbox.center().X
-        top_y = top_y_center - top_bbox.center().Y
-
-        front_x = left_x_center - front_bbox.center().X
-        front_y = bottom_y_center - front_bbox.center().Y
-
-        iso_x = right_x_center - iso_bbox.center().X
-        iso_y = top_y_center - iso_bbox.center().Y
-
-        side_x = right_x_center - side_bbox.center().X
-        side_y = bottom_y_center - side_bbox.center().Y
-
-        # Step 6: Final projection at correct positions
-        top_vis, top_hid = project_to_2d(
-            compound, (0, 0, 100), (0, 1, 0), (top_x, top_y), view_scale
-        )
-        visible_lines.extend(top_vis)
-        hidden_lines.extend(top_hid)
-
-        front_vis, front_hid = project_to_2d(
-            compound, (0, -100, 0), (0, 0, 1), (front_x, front_y), view_scale
-        )
-        visible_lines.extend(front_vis)
-        hidden_lines.extend(front_hid)
-
-        iso_vis, iso_hid = project_to_2d(
-            compound, (100, 100, 100), (0, 0, 1), (iso_x, iso_y), view_scale
-        )
-        visible_lines.extend(iso_vis)
-        hidden_lines.extend(iso_hid)
+        grid_centers = {
+            "top": (left_x_center, top_y_center),
+            "front": (left_x_center, bottom_y_center),
+            "iso": (right_x_center, top_y_center),
+            "side": (right_x_center, bottom_y_center),
+        }
 
-        side_vis, side_hid = project_to_2d(
-            compound, (100, 0, 0), (0, 0, 1), (side_x, side_y), view_scale
-        )
-        visible_lines.extend(side_vis)
-        hidden_lines.extend(side_hid)
+        # Step 4: Scale each view and move its bbox center to the grid center.
+        # Scaling about the origin scales the bbox center by the same factor
+        for name, (x_center, y_center) in grid_centers.items():
+            vis, hid = projections[name]
+            bbox_center = bboxes[name].center()
+            page_origin = (
+                x_center - bbox_center.X * view_scale,
+                y_center - bbox_center.Y * view_scale,
+            )
+            visible_lines.append(place_on_page(vis, page_origin, view_scale))
+            hidden_lines.append(place_on_page(hid, page_origin, view_scale))
 
     except Exception as e:
         echo.error(f"Error generating projections: {e}")
@@ -305,8 +265,9 @@ def drawing(
             "Hidden", line_color=(99, 99, 99), line_type=LineType.ISO_DOT
         )
 
-        exporter.add_shape(visible_lines, layer="Visible")
-        exporter.add_shape(hidden_lines, layer="Hidden")
+        # One compound per layer, so each layer is added with a single shape
+        exporter.add_shape(Build123dCompound(children=visible_lines), layer="Visible")
+        exporter.add_shape(Build123dCompound(children=hidden_lines), layer="Hidden")
         exporter.add_shape(border, layer="Visible")
 
         # Write to temporary SVG
@@ -173,6 +173,9 @@ class Assembly(BaseModel, frozen=True):
         Converts the abstract model into a concrete 3D assembly.
         Generates pilot holes for dowel connections.
 
+        Every call builds a new assembly. Its dict and list fields are
+        mutable, so an assembly is never shared between callers.
+
         Args:
             model: Model containing pieces and connections
 
@@ -12,11 +12,9 @@ from ..geometry import (
     Point2D,
     SurfacePoint,
     Vector2D,
-    Vector3D,
-    cross as cross_face,
 )
 from .constants import DOWEL_EDGE_OFFSET_MM, DOWEL_HORIZONTAL_OFFSET_MM
-from .models import Joint, JointPair
+from .models import Joint, JointPair, _anchor_orientation
 from .projection import project_joint
 
 
@@ -59,10 +57,7 @@ def _create_orientation_from_anchor(anchor: Anchor) -> Orientation3D:
     Returns:
         Orientation3D with direction normal to contact_face and up normal to crossed faces
     """
-    return Orientation3D.of(
-        direction=Vector3D.normal_of(anchor.contact_face),
-        up=Vector3D.normal_of(cross_face(anchor.contact_face, anchor.edge_shared_face)),
-    )
+    return _anchor_orientation(anchor.contact_face, anchor.edge_shared_face)
 
 
 def _create_joint_pair_from_positions(
@@ -112,12 +107,7 @@ def _create_top_down_dowel_joints(
     Returns:
         Tuple of (joint_0, joint_1) at u=+25.4 and u=-25.4
     """
-    orientation = Orientation3D.of(
-        direction=Vector3D.normal_of(src_anchor.contact_face),
-        up=Vector3D.normal_of(
-            cross_face(src_anchor.contact_face, src_anchor.edge_shared_face)
-        ),
-    )
+    orientation = _create_orientation_from_anchor(src_anchor)
 
     src_0 = Joint(
         position=SurfacePoint(
@@ -4,6 +4,8 @@ This module contains the core data structures for representing
 joints and holes in 3D assemblies.
 """
 
+from functools import cache
+
 from pydantic import BaseModel
 
 from ..anchor import BoundAnchor, as_surface_point
@@ -17,6 +19,35 @@ from ..geometry import (
 )
 
 
+@cache
+def _anchor_orientation(
+    contact_face: Face, edge_shared_face: Face, flip_dir: bool = False
+) -> Orientation3D:
+    """Orientation of a joint on an anchor with the given faces.
+
+    The direction is the normal of the contact face and the up vector the
+    normal of the crossed faces, opposite if flip_dir is set. It only
+    depends on the faces, so it is solved once per face combination and
+    the immutable result is shared by every joint with the same signature.
+
+    Examples:
+        >>> orientation = _anchor_orientation("front", "top")
+        >>> orientation.direction.y, orientation.up.x
+        (1.0, 1.0)
+        >>> _anchor_orientation("front", "top") is orientation
+        True
+        >>> _anchor_orientation("front", "top", True).up.x
+        -1.0
+    """
+    up_face = cross_face(contact_face, edge_shared_face)
+    if flip_dir:
+        up_face = opposite_face(up_face)
+    return Orientation3D.of(
+        direction=Vector3D.normal_of(contact_face),
+        up=Vector3D.normal_of(up_face),
+    )
+
+
 class Hole(BaseModel, frozen=True):
     """Specification for a pilot hole.
 
@@ -79,13 +110,8 @@ class Joint(BaseModel, frozen=True):
             Joint with position and orientation based on the anchor
         """
         anchor = bound_anchor.anchor
-
-        up_face = cross_face(anchor.contact_face, anchor.edge_shared_face)
-        if flip_dir:
-            up_face = opposite_face(up_face)
-        orientation = Orientation3D.of(
-            direction=Vector3D.normal_of(anchor.contact_face),
-            up=Vector3D.normal_of(up_face),
+        orientation = _anchor_orientation(
+            anchor.contact_face, anchor.edge_shared_face, flip_dir
         )
 
         position = as_surface_point(bound_anchor)
@@ -4,19 +4,20 @@ This module provides functions for projecting joints and surface points
 between different coordinate systems when connecting pieces.
 """
 
+from functools import cache
+
 import numpy as np
 
-from ..anchor import BoundAnchor, as_orientation, as_surface_point
+from ..anchor import BoundAnchor, as_surface_point
 from ..geometry import (
-    Orientation3D,
+    Face,
     Point2D,
     SurfacePoint,
     Vector2D,
-    Vector3D,
     cross as cross_face,
     opposite as opposite_face,
 )
-from .models import Joint
+from .models import Joint, _anchor_orientation
 
 
 def project_joint(
@@ -70,17 +71,61 @@ def project_joint(
     )
 
     # Calculate orientation for dst (same logic as Joint.of with flip_dir=True)
-    up_face = cross_face(dst_anchor.contact_face, dst_anchor.edge_shared_face)
-    up_face = opposite_face(up_face)  # flip_dir=True
-
-    dst_orientation = Orientation3D.of(
-        direction=Vector3D.normal_of(dst_anchor.contact_face),
-        up=Vector3D.normal_of(up_face),
+    dst_orientation = _anchor_orientation(
+        dst_anchor.contact_face, dst_anchor.edge_shared_face, flip_dir=True
     )
 
     return Joint(position=dst_position, orientation=dst_orientation)
 
 
+@cache
+def _surface_axis_mapping(
+    src_contact_face: Face,
+    src_edge_shared_face: Face,
+    dst_contact_face: Face,
+    dst_edge_shared_face: Face,
+) -> tuple[bool, bool, bool]:
+    """Map surface axes of a source anchor onto those of a destination anchor.
+
+    The mapping only depends on the faces of the two anchors, not on their
+    offsets or pieces, so it is solved once per face combination (at most
+    24 x 24 of them) and looked up by every later projection.
+
+    Returns:
+        (flip_u, flip_v, transpose_axes) to apply to a relative (u, v)
+        position in the source surface to get the destination one
+
+    Examples:
+        >>> _surface_axis_mapping("front", "top", "down", "front")
+        (True, False, False)
+    """
+    src_up_face = cross_face(src_contact_face, src_edge_shared_face)
+    dst_up_face = opposite_face(cross_face(dst_contact_face, dst_edge_shared_face))
+
+    src_anchor_contact_dir = Vector2D.of(src_contact_face, src_edge_shared_face)
+    src_anchor_up_dir = Vector2D.of(src_contact_face, src_up_face)
+    dst_anchor_contact_dir = Vector2D.of(dst_contact_face, dst_edge_shared_face)
+    dst_anchor_up_up = Vector2D.of(dst_contact_face, dst_up_face)
+
+    src_mat = np.array(
+        [
+            [src_anchor_contact_dir.u, src_anchor_contact_dir.v],
+            [src_anchor_up_dir.u, src_anchor_up_dir.v],
+        ]
+    )
+    dst_mat = np.array(
+        [
+            [dst_anchor_contact_dir.u, dst_anchor_contact_dir.v],
+            [dst_anchor_up_up.u, dst_anchor_up_up.v],
+        ]
+    )
+    tr_mat = np.linalg.inv(dst_mat) @ src_mat
+    transpose_axes = bool(abs(np.diag(tr_mat).prod()) < 1e-7)
+    flip_u = bool(tr_mat[:, 0].min() < 0)
+    flip_v = bool(tr_mat[:, 1].min() < 0)
+    return flip_u, flip_v, transpose_axes
+
+
 def _project_surface_point(
     src_bound: BoundAnchor,
     dst_bound: BoundAnchor,
@@ -107,34 +152,12 @@ def _project_surface_point(
     src_anchor = src_bound.anchor
     dst_anchor = dst_bound.anchor
 
-    src_anchor_orientation = as_orientation(src_bound)
-    dst_anchor_orientation = as_orientation(dst_bound, flip_dir=True)
-
-    src_anchor_contact_dir = Vector2D.of(
-        src_anchor.contact_face, src_anchor.edge_shared_face
-    )
-    src_anchor_up_dir = Vector2D.of(src_anchor.contact_face, src_anchor_orientation.up)
-    dst_anchor_contact_dir = Vector2D.of(
-        dst_anchor.contact_face, dst_anchor.edge_shared_face
-    )
-    dst_anchor_up_up = Vector2D.of(dst_anchor.contact_face, dst_anchor_orientation.up)
-
-    src_mat = np.array(
-        [
-            [src_anchor_contact_dir.u, src_anchor_contact_dir.v],
-            [src_anchor_up_dir.u, src_anchor_up_dir.v],
-        ]
-    )
-    dst_mat = np.array(
-        [
-            [dst_anchor_contact_dir.u, dst_anchor_contact_dir.v],
-            [dst_anchor_up_up.u, dst_anchor_up_up.v],
-        ]
+    flip_u, flip_v, transpose_axes = _surface_axis_mapping(
+        src_anchor.contact_face,
+        src_anchor.edge_shared_face,
+        dst_anchor.contact_face,
+        dst_anchor.edge_shared_face,
     )
-    tr_mat = np.linalg.inv(dst_mat) @ src_mat
-    transpose_axes = abs(np.diag(tr_mat).prod()) < 1e-7
-    flip_u = tr_mat[:, 0].min() < 0
-    flip_v = tr_mat[:, 1].min() < 0
 
     src_anchor_surface_point = as_surface_point(src_bound)
     dst_anchor_surface_point = as_surface_point(dst_bound)
@@ -4,6 +4,7 @@ This module defines standard dowel sizes commonly used in DIY woodworking.
 """
 
 from enum import Enum
+from functools import cache
 from typing import TypeAlias
 
 from pydantic import BaseModel
@@ -68,9 +69,13 @@ class Dowel(StringEnumMixin, Enum):
 DowelPreset: TypeAlias = Dowel
 
 
+@cache
 def as_spec(dowel: DowelPreset) -> DowelSpec:
     """Get DowelSpec from a preset dowel type.
 
+    Specs are immutable, so each preset maps to a single shared instance
+    no matter how many connections use it.
+
     Args:
         dowel: A Dowel enum member
 
@@ -83,6 +88,8 @@ def as_spec(dowel: DowelPreset) -> DowelSpec:
         8.0
         >>> spec.length
         30.0
+        >>> as_spec(Dowel.D8_L30) is as_spec(Dowel.D8_L30)
+        True
     """
     diameter_str, length_str = dowel.value.split("x")
     return DowelSpec(diameter=float(diameter_str), length=float(length_str))
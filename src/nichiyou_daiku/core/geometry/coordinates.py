@@ -486,7 +486,7 @@ class Orientation3D(BaseModel, frozen=True):
         up_ortho_z = up.z - dot * direction.z
 
         # Normalize
-        magnitude = math.sqrt(up_ortho_x**2 + up_ortho_y**2 + up_ortho_z**2)
+        magnitude = math.hypot(up_ortho_x, up_ortho_y, up_ortho_z)
         if magnitude < 1e-6:
             raise ValueError("Up vector is parallel to direction vector")
 
@@ -549,7 +549,7 @@ class Orientation3D(BaseModel, frozen=True):
     def _from_vectors(cls, direction: Vector3D, up: Vector3D) -> "Orientation3D":
         """Create from direction and up vectors."""
         # Normalize direction
-        dir_mag = math.sqrt(direction.x**2 + direction.y**2 + direction.z**2)
+        dir_mag = math.hypot(direction.x, direction.y, direction.z)
         if dir_mag < 1e-6:
             raise ValueError("Direction vector has zero magnitude")
 
@@ -171,6 +171,17 @@ def is_back_to_front_axis(face: Face) -> bool:
     return face in ("front", "back")
 
 
+# Axis index (0: X, 1: Y, 2: Z) of each face, so axis checks are one lookup
+_AXIS_OF: dict[Face, int] = {
+    "left": 0,
+    "right": 0,
+    "back": 1,
+    "front": 1,
+    "down": 2,
+    "top": 2,
+}
+
+
 def is_same_axis(lhs: Face, rhs: Face) -> bool:
     """Check if two faces are on the same axis.
 
@@ -193,11 +204,21 @@ def is_same_axis(lhs: Face, rhs: Face) -> bool:
         >>> is_same_axis("top", "left")
         False
     """
-    return (
-        (is_down_to_top_axis(lhs) and is_down_to_top_axis(rhs))
-        or (is_left_to_right_axis(lhs) and is_left_to_right_axis(rhs))
-        or (is_back_to_front_axis(lhs) and is_back_to_front_axis(rhs))
-    )
+    return _AXIS_OF[lhs] == _AXIS_OF[rhs]
+
+
+# Bit 6 * i + j of the mask is set when the faces with indices i and j are
+# adjacent, i.e. lie on different axes, so adjacency is a shift and a mask
+_FACE_INDEX: dict[Face, int] = {
+    face: index
+    for index, face in enumerate(("top", "down", "left", "right", "front", "back"))
+}
+_ADJACENT_MASK: int = sum(
+    1 << (_FACE_INDEX[lhs] * 6 + _FACE_INDEX[rhs])
+    for lhs in _FACE_INDEX
+    for rhs in _FACE_INDEX
+    if _AXIS_OF[lhs] != _AXIS_OF[rhs]
+)
 
 
 def is_adjacent(lhs: Face, rhs: Face) -> bool:
@@ -220,7 +241,7 @@ def is_adjacent(lhs: Face, rhs: Face) -> bool:
         >>> is_adjacent("top", "down")
         False
     """
-    return lhs != rhs and not is_same_axis(lhs, rhs)
+    return bool(_ADJACENT_MASK >> (_FACE_INDEX[lhs] * 6 + _FACE_INDEX[rhs]) & 1)
 
 
 def is_positive(face: Face) -> bool:
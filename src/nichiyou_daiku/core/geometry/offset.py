@@ -1,3 +1,5 @@
+from typing import ClassVar
+
 from pydantic import BaseModel
 
 from .dimensions import Millimeters
@@ -23,6 +25,11 @@ class FromMax(BaseModel, frozen=True):
 
     value: Millimeters
 
+    ZERO: ClassVar["FromMax"]
+
+
+FromMax.ZERO = FromMax(value=0.0)
+
 
 class FromMin(BaseModel, frozen=True):
     """Offset measured from the minimum edge of a dimension.
@@ -36,11 +43,21 @@ class FromMin(BaseModel, frozen=True):
         >>> min_offset = FromMin(value=100.0)
         >>> type(max_offset) != type(min_offset)
         True
+        >>> # Zero offsets can share one instance
+        >>> FromMin.ZERO == FromMin(value=0)
+        True
     """
 
     value: Millimeters
 
+    ZERO: ClassVar["FromMin"]
+
+
+FromMin.ZERO = FromMin(value=0.0)
+
 
+# Offsets are frozen, so an offset instance, such as the shared ZERO of
+# each type, can be reused by any number of anchors
 Offset = FromMax | FromMin
 
 
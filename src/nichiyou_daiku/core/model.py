@@ -4,14 +4,39 @@ This module provides the main Model class that represents a complete
 woodworking project with pieces and their connections.
 """
 
-from typing import Iterable
+from typing import Iterable, NamedTuple
 
+import numpy as np
 from pydantic import BaseModel
 
-from nichiyou_daiku.core.piece import Piece
+from nichiyou_daiku.core.piece import Piece, PieceType, get_shape
 from nichiyou_daiku.core.connection import Connection
 
 
+class PieceArrays(NamedTuple):
+    """Column-wise view of a model's pieces.
+
+    Entry i of every per-piece array describes the i-th piece of
+    Model.pieces, so bulk computations over pieces can use array operations
+    instead of visiting Piece objects one by one.
+
+    Attributes:
+        ids: Piece IDs
+        types: Distinct piece types, in order of first appearance
+        type_rows: Index into types for each piece
+        lengths: Length of each piece in millimeters
+        widths: Cross-section width of each piece in millimeters
+        heights: Cross-section height of each piece in millimeters
+    """
+
+    ids: tuple[str, ...]
+    types: tuple[PieceType, ...]
+    type_rows: np.ndarray
+    lengths: np.ndarray
+    widths: np.ndarray
+    heights: np.ndarray
+
+
 class Model(BaseModel, frozen=True):
     """Complete model of a woodworking project.
 
@@ -66,6 +91,84 @@ class Model(BaseModel, frozen=True):
     connections: dict[tuple[str, str], Connection]
     label: str | None = None
 
+    def __hash__(self) -> int:
+        """Hash the model by content so it can key caches.
+
+        Pieces and connections are hashed as sets, matching dict equality,
+        which ignores insertion order.
+
+        Examples:
+            >>> from nichiyou_daiku.core.piece import Piece, PieceType
+            >>> p1 = Piece.of(PieceType.PT_2x4, 1000.0, "p1")
+            >>> p2 = Piece.of(PieceType.PT_2x4, 800.0, "p2")
+            >>> lhs = Model.of(pieces=[p1, p2], connections=[])
+            >>> rhs = Model.of(pieces=[p2, p1], connections=[])
+            >>> lhs == rhs and hash(lhs) == hash(rhs)
+            True
+        """
+        return hash(
+            (
+                frozenset(self.pieces.items()),
+                frozenset(self.connections.items()),
+                self.label,
+            )
+        )
+
+    def as_arrays(self) -> PieceArrays:
+        """Lay out the pieces as parallel arrays.
+
+        Cross-sections are looked up once per piece type and broadcast to
+        the pieces of that type.
+
+        Returns:
+            PieceArrays holding one entry per piece
+
+        Examples:
+            >>> from nichiyou_daiku.core.piece import Piece, PieceType
+            >>> model = Model.of(
+            ...     pieces=[
+            ...         Piece.of(PieceType.PT_2x4, 1000.0, "p1"),
+            ...         Piece.of(PieceType.PT_1x4, 600.0, "p2"),
+            ...         Piece.of(PieceType.PT_2x4, 800.0, "p3"),
+            ...     ],
+            ...     connections=[],
+            ... )
+            >>> arrays = model.as_arrays()
+            >>> arrays.ids
+            ('p1', 'p2', 'p3')
+            >>> arrays.type_rows.tolist()
+            [0, 1, 0]
+            >>> arrays.lengths.tolist()
+            [1000.0, 600.0, 800.0]
+            >>> arrays.heights.tolist()
+            [38.0, 19.0, 38.0]
+        """
+        pieces = self.pieces.values()
+        type_rows_of: dict[PieceType, int] = {}
+        type_rows = np.fromiter(
+            (
+                type_rows_of.setdefault(piece.type, len(type_rows_of))
+                for piece in pieces
+            ),
+            dtype=np.intp,
+            count=len(pieces),
+        )
+        lengths = np.fromiter(
+            (piece.length for piece in pieces), dtype=float, count=len(pieces)
+        )
+        cross_sections = np.array(
+            [(shape.width, shape.height) for shape in map(get_shape, type_rows_of)],
+            dtype=float,
+        ).reshape(-1, 2)
+        return PieceArrays(
+            ids=tuple(self.pieces),
+            types=tuple(type_rows_of),
+            type_rows=type_rows,
+            lengths=lengths,
+            widths=cross_sections[type_rows, 0],
+            heights=cross_sections[type_rows, 1],
+        )
+
     @classmethod
     def of(
         cls,
@@ -76,6 +179,9 @@ class Model(BaseModel, frozen=True):
         """Create a Model instance from pieces and connections.
 
         Factory method that builds the internal dictionaries from iterables.
+        Both iterables are consumed once and the piece references are checked
+        after indexing, so generated designs can pass generators and build
+        the whole model in a single call.
 
         Args:
             pieces: Iterable of Piece objects
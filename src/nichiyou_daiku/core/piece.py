@@ -5,10 +5,10 @@ nichiyou-daiku woodworking system.
 """
 
 from enum import Enum
-from typing import Type, overload
+from typing import Iterable, Type, overload
 from uuid import uuid4
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from nichiyou_daiku.core.geometry import Millimeters, Shape2D, Shape3D
 
@@ -114,6 +114,51 @@ class Piece(BaseModel, frozen=True):
             id_ = str(uuid4())
         return cls(id=id_, type=piece_type, length=length)
 
+    @classmethod
+    def of_many(
+        cls: Type["Piece"],
+        piece_type: PieceType,
+        lengths: Iterable[Millimeters],
+        ids: Iterable[str],
+    ) -> list["Piece"]:
+        """Create many pieces of the same type in one batch.
+
+        All lengths are validated in a single call, after which the pieces
+        are constructed without re-running validation one by one.
+
+        Args:
+            piece_type: Type of lumber shared by all pieces
+            lengths: Length of each piece in millimeters
+            ids: ID of each piece, paired with lengths in order
+
+        Returns:
+            New Piece instances in the order of lengths
+
+        Raises:
+            ValidationError: If any length is negative
+            ValueError: If lengths and ids differ in size
+
+        Examples:
+            >>> pieces = Piece.of_many(PieceType.PT_2x4, [100, 200.0], ["a", "b"])
+            >>> [(p.id, p.length) for p in pieces]
+            [('a', 100.0), ('b', 200.0)]
+            >>> pieces[0] == Piece.of(PieceType.PT_2x4, 100.0, "a")
+            True
+        """
+        piece_type = PieceType(piece_type)
+        validated = _LENGTHS_ADAPTER.validate_python(list(lengths))
+        ids = list(ids)
+        if len(ids) != len(validated):
+            raise ValueError(f"Got {len(validated)} lengths but {len(ids)} ids")
+        return [
+            cls.model_construct(id=id_, type=piece_type, length=length)
+            for id_, length in zip(ids, validated)
+        ]
+
+
+# Validates a whole batch of lengths at once, see Piece.of_many
+_LENGTHS_ADAPTER = TypeAdapter(list[Millimeters])
+
 
 @overload
 def get_shape(value: PieceType) -> Shape2D: ...
@@ -154,10 +199,19 @@ def get_shape(value: PieceType | Piece):
             return _get_shape_of_piece(value)
 
 
+# Actual cross-section dimensions in mm, one shared Shape2D per piece type
+_CROSS_SECTIONS: dict[PieceType, Shape2D] = {
+    PieceType.PT_2x4: Shape2D(width=89.0, height=38.0),
+    PieceType.PT_1x4: Shape2D(width=89.0, height=19.0),
+}
+
+
 def _get_shape_of_piece_type(piece_type: PieceType) -> Shape2D:
     """Get the 2D cross-section shape of a piece type.
 
     Internal function that maps piece types to their actual dimensions.
+    PieceType is a closed enum and Shape2D is immutable, so the shapes are
+    built once at import time and a lookup returns the shared instance.
 
     Args:
         piece_type: Type of lumber
@@ -171,12 +225,12 @@ def _get_shape_of_piece_type(piece_type: PieceType) -> Shape2D:
         89.0
         >>> shape.height  # Actual 2x4 height
         38.0
+        >>> _get_shape_of_piece_type(PieceType.PT_2x4) is shape
+        True
     """
-    match piece_type:
-        case PieceType.PT_2x4:
-            return Shape2D(width=89.0, height=38.0)  # 2x4 actual dimensions in mm
-        case PieceType.PT_1x4:
-            return Shape2D(width=89.0, height=19.0)  #
+    shape = _CROSS_SECTIONS.get(piece_type)
+    if shape is not None:
+        return shape
 
     raise RuntimeError(
         f"Unsupported piece type: {piece_type}. "
@@ -205,5 +259,6 @@ def _get_shape_of_piece(piece: Piece) -> Shape3D:
         >>> shape.length
         1500.0
     """
-    shape_2d = get_shape(piece.type)
+    # Look up the folded cross-section directly, skipping get_shape's dispatch
+    shape_2d = _get_shape_of_piece_type(piece.type)
     return Shape3D(width=shape_2d.width, height=shape_2d.height, length=piece.length)
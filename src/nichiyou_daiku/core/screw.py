@@ -5,6 +5,7 @@ including slim screws (スリムビス) and coarse thread screws (コースス
 """
 
 from enum import Enum
+from functools import cache
 from typing import TypeAlias
 
 from pydantic import BaseModel
@@ -110,9 +111,13 @@ class CoarseThreadScrew(StringEnumMixin, Enum):
 ScrewPreset: TypeAlias = SlimScrew | CoarseThreadScrew
 
 
+@cache
 def as_spec(screw: ScrewPreset) -> ScrewSpec:
     """Get ScrewSpec from a preset screw type.
 
+    Specs are immutable, so each preset maps to a single shared instance
+    no matter how many connections use it.
+
     Args:
         screw: A SlimScrew or CoarseThreadScrew enum member
 
@@ -130,6 +135,8 @@ def as_spec(screw: ScrewPreset) -> ScrewSpec:
         3.8
         >>> spec.length
         57.0
+        >>> as_spec(CoarseThreadScrew.D3_8_L57) is as_spec(CoarseThreadScrew.D3_8_L57)
+        True
     """
     # Parse "diameter x length" format
     diameter_str, length_str = screw.value.split("x")
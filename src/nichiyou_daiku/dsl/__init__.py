@@ -10,10 +10,18 @@ from nichiyou_daiku.dsl.exceptions import (
     DSLSyntaxError,
     DSLValidationError,
 )
-from nichiyou_daiku.dsl.parser import parse_dsl
+from nichiyou_daiku.dsl.parser import (
+    DSLTemplate,
+    compile_dsl,
+    parse_dsl,
+    parse_dsl_stream,
+)
 
 __all__ = [
     "parse_dsl",
+    "parse_dsl_stream",
+    "compile_dsl",
+    "DSLTemplate",
     "DSLError",
     "DSLSyntaxError",
     "DSLSemanticError",
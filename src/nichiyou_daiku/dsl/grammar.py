@@ -2,6 +2,8 @@
 
 GRAMMAR = r"""
 start: statement+
+// Entry point for a slice of a streamed document, see parse_dsl_stream
+chunk: statement*
 
 statement: piece_def | connection_def
 
@@ -65,3 +67,11 @@ COMMENT: "//" /[^\n]*/
 %ignore WS
 %ignore COMMENT
 """
+
+# Templates accept "$name" parameters wherever a number is expected. The
+# parameters are lexed as NUMBER tokens, so binding them only swaps token
+# values and the parse tree keeps the shape the transformer expects.
+TEMPLATE_GRAMMAR = GRAMMAR.replace(
+    "%import common.NUMBER\n",
+    '%import common.NUMBER -> LITERAL_NUMBER\nNUMBER: LITERAL_NUMBER | "$" CNAME\n',
+)
@@ -1,6 +1,9 @@
 """DSL parser using Lark."""
 
-from lark import Lark, ParseError, UnexpectedInput
+from functools import cache, lru_cache
+from typing import Any, Iterable
+
+from lark import Lark, ParseError, Token, Transformer, Tree, UnexpectedInput
 from lark.exceptions import VisitError
 
 from nichiyou_daiku.core.model import Model
@@ -9,10 +12,31 @@ from nichiyou_daiku.dsl.exceptions import (
     DSLSemanticError,
     DSLValidationError,
 )
-from nichiyou_daiku.dsl.grammar import GRAMMAR
+from nichiyou_daiku.dsl.grammar import GRAMMAR, TEMPLATE_GRAMMAR
 from nichiyou_daiku.dsl.transformer import DSLTransformer
 
 
+@cache
+def _build_lark(debug: bool, template: bool = False, start: str = "start") -> Lark:
+    """Compile the DSL grammar into a LALR parser.
+
+    Building the parse table is by far the most expensive step of parsing a
+    short document, and the result does not depend on the input, so one
+    parser per debug setting is shared by every DSLParser.
+
+    With template set, the grammar additionally accepts "$name" parameters
+    in place of numbers (see compile_dsl). start selects the entry rule;
+    "chunk" parses a slice of a streamed document (see parse_dsl_stream).
+    """
+    return Lark(
+        TEMPLATE_GRAMMAR if template else GRAMMAR,
+        parser="lalr",
+        start=start,
+        debug=debug,
+        propagate_positions=True,
+    )
+
+
 class DSLParser:
     """Parser for the nichiyou-daiku DSL."""
 
@@ -23,13 +47,7 @@ class DSLParser:
             debug: If True, enables debug mode for the parser.
         """
         self.debug = debug
-        self._parser = Lark(
-            GRAMMAR,
-            parser="lalr",
-            debug=debug,
-            propagate_positions=True,
-        )
-        self._transformer = DSLTransformer()
+        self._parser = _build_lark(debug)
 
     def parse(self, dsl_string: str) -> Model:
         """Parse a DSL string and return a Model instance.
@@ -43,37 +61,67 @@ class DSLParser:
         Raises:
             DSLSyntaxError: If the DSL syntax is invalid.
         """
-        try:
-            tree = self._parser.parse(dsl_string)
-            if self.debug:
-                print("Parse tree:")
-                print(tree.pretty())
-            return self._transformer.transform(tree)
-        except UnexpectedInput as e:
-            raise DSLSyntaxError(
-                str(e),
-                line=e.line,
-                column=e.column,
-            )
-        except ParseError as e:
-            raise DSLSyntaxError(str(e))
-        except VisitError as e:
-            # Extract the actual error from the VisitError
-            if e.orig_exc and isinstance(
-                e.orig_exc, (DSLSemanticError, DSLValidationError)
-            ):
-                raise e.orig_exc
-            else:
-                raise DSLSemanticError(str(e))
-
-
-def parse_dsl(dsl_string: str, debug: bool = False) -> Model:
+        tree = _parse_tree(self._parser, dsl_string)
+        if self.debug:
+            print("Parse tree:")
+            print(tree.pretty())
+        return _transform(tree)
+
+
+def _parse_tree(
+    parser: Lark, dsl_string: str, line_offset: int = 0, column_offset: int = 0
+) -> Tree:
+    """Parse a DSL string into a tree, raising DSLSyntaxError on failure.
+
+    When the string is a slice of a larger document, line_offset is added to
+    reported line numbers, and column_offset to columns on the slice's first
+    line, which continues the last line of the preceding text.
+    """
+    try:
+        return parser.parse(dsl_string)
+    except UnexpectedInput as e:
+        raise DSLSyntaxError(
+            str(e),
+            line=e.line + line_offset if e.line > 0 else e.line,
+            column=e.column + column_offset if e.line == 1 else e.column,
+        )
+    except ParseError as e:
+        raise DSLSyntaxError(str(e))
+
+
+def _transform(tree: Tree, transformer: DSLTransformer | None = None) -> Any:
+    """Transform a parse tree, unwrapping transformer errors.
+
+    A start tree yields a Model. The transformer accumulates pieces while
+    walking the tree, so each document gets a fresh one unless a transformer
+    shared by the slices of a streamed document is passed.
+    """
+    if transformer is None:
+        transformer = DSLTransformer()
+    try:
+        return transformer.transform(tree)
+    except VisitError as e:
+        # Extract the actual error from the VisitError
+        if e.orig_exc and isinstance(
+            e.orig_exc, (DSLSemanticError, DSLValidationError)
+        ):
+            raise e.orig_exc
+        else:
+            raise DSLSemanticError(str(e))
+
+
+def parse_dsl(dsl_string: str | bytes, debug: bool = False) -> Model:
     """Parse a DSL string and return a Model instance.
 
     This is a convenience function that creates a parser and parses the string.
+    Parse trees are cached by input text, so parsing the same document again
+    skips the parser. Every call still builds a new model from the tree, so
+    models are never shared, and pieces declared without an ID get a fresh
+    generated ID each time.
 
     Args:
-        dsl_string: The DSL string to parse.
+        dsl_string: The DSL string to parse. UTF-8 encoded bytes, e.g. read
+            straight from a file, are accepted as well.
         debug: If True, enables debug mode for the parser.
 
     Returns:
@@ -83,6 +131,185 @@ def parse_dsl(dsl_string: str, debug: bool = False) -> Model:
         DSLSyntaxError: If the DSL syntax is invalid.
         DSLSemanticError: If the DSL is semantically incorrect.
         DSLValidationError: If DSL values fail validation.
+
+    Examples:
+        >>> first = parse_dsl(b"(leg:2x4 =720)")
+        >>> second = parse_dsl("(leg:2x4 =720)")
+        >>> first == second and first is not second
+        True
+    """
+    if isinstance(dsl_string, bytes):
+        # The lexer matches str patterns, so bytes are decoded once up front;
+        # an ASCII document decodes into a compact one byte per char str
+        dsl_string = dsl_string.decode("utf-8")
+    if debug:
+        # Debug mode prints the parse tree, so it always parses
+        return DSLParser(debug=True).parse(dsl_string)
+    return _transform(_parse_tree_cached(dsl_string))
+
+
+@lru_cache(maxsize=128)
+def _parse_tree_cached(dsl_string: str) -> Tree:
+    """Parse a DSL string into a tree, memoized on the input text.
+
+    DSLTransformer builds new objects from the tree without modifying it,
+    so a cached tree can be transformed any number of times.
+    """
+    return _parse_tree(_build_lark(False), dsl_string)
+
+
+def parse_dsl_stream(chunks: Iterable[str]) -> Model:
+    """Parse a DSL document supplied as a sequence of text chunks.
+
+    Each chunk is parsed and transformed as soon as it is received, so a
+    generated document never has to be held in memory as a whole. Chunks
+    must hold complete statements (any number, including none); a statement
+    cannot be split across two chunks. Statements may refer to pieces
+    declared in earlier chunks.
+
+    Args:
+        chunks: Iterable of DSL text slices, e.g. a generator yielding one
+            statement at a time.
+
+    Returns:
+        A Model instance representing the whole document.
+
+    Raises:
+        DSLSyntaxError: If a chunk's syntax is invalid. Line and column
+            numbers count from the start of the document, also when a chunk
+            does not end with a newline.
+        DSLSemanticError: If the DSL is semantically incorrect.
+        DSLValidationError: If DSL values fail validation.
+
+    Examples:
+        >>> def statements():
+        ...     yield "(leg:2x4 =720)"
+        ...     for i in range(3):
+        ...         yield f"(top_{i}:1x4 =600)"
+        >>> model = parse_dsl_stream(statements())
+        >>> list(model.pieces)
+        ['leg', 'top_0', 'top_1', 'top_2']
+    """
+    parser = _build_lark(False, start="chunk")
+    transformer = DSLTransformer()
+    line_offset = 0
+    column_offset = 0
+    for chunk in chunks:
+        _transform(_parse_tree(parser, chunk, line_offset, column_offset), transformer)
+        # A chunk ending mid-line leaves the next chunk to continue that line
+        newlines = chunk.count("\n")
+        tail = len(chunk) - chunk.rfind("\n") - 1
+        column_offset = tail if newlines else column_offset + tail
+        line_offset += newlines
+    return transformer.start([])
+
+
+class _ParameterBinder(Transformer):
+    """Replace "$name" NUMBER tokens of a template tree with their values."""
+
+    def __init__(self, values: dict[str, str]):
+        super().__init__(visit_tokens=True)
+        self._values = values
+
+    def NUMBER(self, token: Token) -> Token:
+        if not token.startswith("$"):
+            return token
+        return Token.new_borrow_pos("NUMBER", self._values[token[1:]], token)
+
+    def __default__(self, data, children, meta) -> Tree:
+        return Tree(data, children, meta)
+
+
+class DSLTemplate:
+    """A DSL document with numeric parameters, parsed once.
+
+    Templates are created by compile_dsl. Each instantiate call only
+    substitutes the parameter values into the stored parse tree and builds
+    the model, so sweeping over many parameter sets does not lex and parse
+    the document again.
+    """
+
+    def __init__(self, tree: Tree):
+        """Initialize the template.
+
+        Args:
+            tree: Parse tree of the template document.
+        """
+        self._tree = tree
+        self._parameters = frozenset(
+            str(token)[1:]
+            for token in tree.scan_values(
+                lambda v: isinstance(v, Token) and v.type == "NUMBER"
+            )
+            if token.startswith("$")
+        )
+
+    @property
+    def parameters(self) -> frozenset[str]:
+        """Names of the parameters used by the template."""
+        return self._parameters
+
+    def instantiate(self, **values: float) -> Model:
+        """Build the model for one set of parameter values.
+
+        Args:
+            **values: Value of every template parameter, by name.
+
+        Returns:
+            A Model instance with the parameters replaced by their values.
+
+        Raises:
+            DSLValidationError: If a parameter is missing, unknown or not a
+                number.
+            DSLSemanticError: If the bound document is semantically incorrect.
+        """
+        missing = self._parameters - values.keys()
+        if missing:
+            raise DSLValidationError(
+                f"Missing template parameters: {', '.join(sorted(missing))}"
+            )
+        unknown = values.keys() - self._parameters
+        if unknown:
+            raise DSLValidationError(
+                f"Unknown template parameters: {', '.join(sorted(unknown))}"
+            )
+
+        literals: dict[str, str] = {}
+        for name, value in values.items():
+            try:
+                literals[name] = repr(float(value))
+            except (TypeError, ValueError):
+                raise DSLValidationError(
+                    f"Template parameter '{name}' must be a number: {value!r}"
+                )
+
+        return _transform(_ParameterBinder(literals).transform(self._tree))
+
+
+def compile_dsl(dsl_string: str) -> DSLTemplate:
+    """Parse a DSL template whose numbers may be "$name" parameters.
+
+    Parameters can appear anywhere the DSL expects a number: lengths,
+    offsets and connection sizes. Separate a parameter from a following
+    letter with whitespace, e.g. "D(:$d x $l)".
+
+    Args:
+        dsl_string: The DSL template to parse.
+
+    Returns:
+        A DSLTemplate to instantiate with parameter values.
+
+    Raises:
+        DSLSyntaxError: If the DSL syntax is invalid.
+
+    Examples:
+        >>> template = compile_dsl("(leg:2x4 =$height) (top:1x4 =$width)")
+        >>> sorted(template.parameters)
+        ['height', 'width']
+        >>> model = template.instantiate(height=720, width=600)
+        >>> model.pieces["leg"].length
+        720.0
+        >>> template.instantiate(height=750, width=600).pieces["leg"].length
+        750.0
     """
-    parser = DSLParser(debug=debug)
-    return parser.parse(dsl_string)
+    return DSLTemplate(_parse_tree(_build_lark(False, template=True), dsl_string))
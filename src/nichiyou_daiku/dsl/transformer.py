@@ -25,7 +25,7 @@ from nichiyou_daiku.dsl.exceptions import DSLSemanticError, DSLValidationError
 T = TypeVar("T", DowelConnection, ScrewConnection)
 
 
-@dataclass
+@dataclass(slots=True)
 class PieceComponents:
     """Components parsed from a piece definition."""
 
@@ -35,7 +35,7 @@ class PieceComponents:
     length_value: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionComponents:
     """Components parsed from a connection definition."""
 
@@ -212,18 +212,15 @@ class DSLTransformer(Transformer):
             return {}
         return items[0] if items else {}
 
-    def prop_list(self, items: list[dict[str, Any]]) -> dict[str, Any]:
+    def prop_list(self, items: list[tuple[str, Any]]) -> dict[str, Any]:
         """Combine multiple properties into a single dictionary."""
-        result = {}
-        for prop in items:
-            result.update(prop)
-        return result
+        return dict(items)
 
-    def prop(self, items: list[Any]) -> dict[str, Any]:
-        """Transform a single property."""
+    def prop(self, items: list[Any]) -> tuple[str, Any]:
+        """Transform a single property into a key-value pair."""
         key = self._unescape_string(items[0])
         value = items[1]
-        return {key: value}
+        return key, value
 
     def compact_length(self, items: list[Any]) -> float:
         """Transform compact length notation (=NUMBER)."""
@@ -351,15 +348,12 @@ class DSLTransformer(Transformer):
             return {}
         return items[0] if items else {}
 
-    def anchor_prop_list(self, items: list[dict[str, Any]]) -> dict[str, Any]:
+    def anchor_prop_list(self, items: list[tuple[str, Any]]) -> dict[str, Any]:
         """Combine multiple anchor properties."""
-        result = {}
-        for prop in items:
-            result.update(prop)
-        return result
+        return dict(items)
 
-    def anchor_prop(self, items: list[Any]) -> dict[str, Any]:
-        """Transform a single anchor property."""
+    def anchor_prop(self, items: list[Any]) -> tuple[str, Any]:
+        """Transform a single anchor property into a key-value pair."""
         key = self._unescape_string(items[0])
         value = items[1]
 
@@ -367,7 +361,7 @@ class DSLTransformer(Transformer):
         if hasattr(value, "type") and value.type == "ESCAPED_STRING":
             value = self._unescape_string(value)
 
-        return {key: value}
+        return key, value
 
     def offset_value(self, items: list[Any]) -> Offset:
         """Transform an offset value."""
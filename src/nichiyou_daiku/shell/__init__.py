@@ -4,6 +4,8 @@ This package contains modules that interact with external systems,
 following the functional core, imperative shell pattern.
 """
 
+import importlib.util
+
 # Always available report generation and resource extraction
 from .report_generator import generate_markdown_report  # noqa: F401
 from .resources import (  # noqa: F401
@@ -21,13 +23,17 @@ __all__ = [
     "AnchorInfo",
 ]
 
-# Only expose assembly_to_build123d if build123d is available
-try:
-    from .build123d_export import HAS_BUILD123D
+# build123d pulls in OpenCascade, which is slow to load, so the exporter is
+# only imported when assembly_to_build123d is first looked up. It is only
+# exposed if build123d is available
+if importlib.util.find_spec("build123d") is not None:
+    __all__.append("assembly_to_build123d")
+
 
-    if HAS_BUILD123D:
-        from .build123d_export import assembly_to_build123d  # noqa: F401
+def __getattr__(name: str):
+    if name == "assembly_to_build123d":
+        from .build123d_export import HAS_BUILD123D, assembly_to_build123d
 
-        __all__.append("assembly_to_build123d")
-except ImportError:
-    pass
+        if HAS_BUILD123D:
+            return assembly_to_build123d
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,7 +7,7 @@ representation to build123d objects that can be visualized in CAD tools.
 import math
 from collections import deque
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 import numpy as np
 
@@ -56,49 +56,50 @@ if TYPE_CHECKING:
     )
 
 
-def _as_euler_angles(
-    orientation: Orientation3D, *, flip_dir: bool = False
-) -> tuple[float, float, float]:
-    dir_vec = np.asarray(
-        [orientation.direction.x, orientation.direction.y, orientation.direction.z],
-        dtype=float,
-    )
-
-    up_vec = np.asarray(
-        [orientation.up.x, orientation.up.y, orientation.up.z], dtype=float
-    )
+def _as_euler_angles_batch(directions: np.ndarray, ups: np.ndarray) -> np.ndarray:
+    """Convert joint orientations to XYZ Euler angles in one vectorized pass.
 
-    if flip_dir:
-        dir_vec = -dir_vec
+    Args:
+        directions: (N, 3) array of joint direction vectors
+        ups: (N, 3) array of joint up vectors
 
-    dir_vec /= np.linalg.norm(dir_vec)
-    up_vec /= np.linalg.norm(up_vec)
+    Returns:
+        (N, 3) array of (rx, ry, rz) angles in degrees
+    """
+    dir_vecs = directions / np.linalg.norm(directions, axis=1, keepdims=True)
+    up_vecs = ups / np.linalg.norm(ups, axis=1, keepdims=True)
 
     # Calculate orthonormal basis vectors
-    right = np.cross(dir_vec, up_vec)
-    right /= np.linalg.norm(right)
-
-    up = np.cross(right, dir_vec)
-    up /= np.linalg.norm(up)
-
-    # Create rotation matrix
-    R = np.column_stack((right, up, -dir_vec))
-
-    # Extract Euler angles from rotation matrix
-    sy = R[0, 2]
-    if abs(sy) < 0.999999:
-        ry = math.asin(sy)
-        rx = math.atan2(-R[1, 2], R[2, 2])
-        rz = math.atan2(-R[0, 1], R[0, 0])
-    else:  # gimbal‑lock
-        ry = math.copysign(math.pi / 2, sy)
-        rx = math.atan2(math.copysign(1.0, sy) * R[1, 0], R[1, 1])
-        rz = 0.0
+    right = np.cross(dir_vecs, up_vecs)
+    right /= np.linalg.norm(right, axis=1, keepdims=True)
+
+    up = np.cross(right, dir_vecs)
+    up /= np.linalg.norm(up, axis=1, keepdims=True)
+
+    # The rotation matrix has columns (right, up, -dir); only the entries
+    # needed for the Euler decomposition are read from the basis vectors
+    sy = -dir_vecs[:, 0]  # R[0, 2]
+    regular = np.abs(sy) < 0.999999
+    sign = np.copysign(1.0, sy)
+
+    ry = np.where(regular, np.arcsin(np.clip(sy, -1.0, 1.0)), sign * (math.pi / 2))
+    rx = np.where(
+        regular,
+        np.arctan2(dir_vecs[:, 1], -dir_vecs[:, 2]),  # atan2(-R[1, 2], R[2, 2])
+        np.arctan2(sign * right[:, 1], up[:, 1]),  # gimbal lock: R[1, 0], R[1, 1]
+    )
+    rz = np.where(regular, np.arctan2(-up[:, 0], right[:, 0]), 0.0)
 
     # Convert radians to degrees
-    angles = np.degrees([rx, ry, rz])
+    angles = np.degrees(np.column_stack((rx, ry, rz)))
     angles[np.isclose(angles, 0.0, atol=1e-10)] = 0.0
-    return tuple(angles)
+    return angles
+
+
+def _as_row(orientation: Orientation3D) -> tuple[float, ...]:
+    """Flatten an orientation to (dx, dy, dz, ux, uy, uz)."""
+    direction, up = orientation.direction, orientation.up
+    return (direction.x, direction.y, direction.z, up.x, up.y, up.z)
 
 
 def _as_tuple(point: Point3D) -> tuple[float, float, float]:
@@ -192,11 +193,10 @@ def _create_piece_from(
         else:
             piece = filleted  # type: ignore
 
-    # Subtract pilot holes after fillet
+    # Subtract pilot holes after fillet, all in a single boolean cut rather
+    # than rebuilding the solid once per hole
     if pilot_holes:
-        for point, hole in pilot_holes:
-            hole_cylinder = _create_hole(point, hole, box)
-            piece = piece - hole_cylinder
+        piece = piece - [_create_hole(point, hole, box) for point, hole in pilot_holes]
 
     piece.label = id
     return piece  # type: ignore
@@ -207,7 +207,7 @@ def _create_joint_from(
     box: NichiyouBox,
     label: str,
     to_part: "Part",
-    flip_dir: bool = False,
+    angles: tuple[float, float, float],
 ) -> "RigidJoint":
     """Create a build123d RigidJoint from a nichiyou Joint.
 
@@ -216,40 +216,78 @@ def _create_joint_from(
         box: The box for converting SurfacePoint to Point3D
         label: Label for the rigid joint
         to_part: The Part this joint belongs to
-        flip_dir: Whether to flip the direction vector (for target joints)
+        angles: Euler angles of the joint, see _as_euler_angles_batch
 
     Returns:
         A build123d RigidJoint
     """
-    orientation = joint.orientation
     # Convert SurfacePoint to Point3D using the box
     position = Point3D.of(box, joint.position)
 
     return RigidJoint(
         label=label,
         to_part=to_part,
-        joint_location=Location(
-            _as_tuple(position), _as_euler_angles(orientation, flip_dir=flip_dir)
-        ),
+        joint_location=Location(_as_tuple(position), angles),
     )
 
 
-def _connect(parts, src_joint_id: str, dst_joint_id: str):
+def _connect(parts, src_id: str, dst_id: str):
     """Connect two parts using their rigid joints.
 
     Args:
         parts: Dictionary mapping part IDs to Part objects
-        src_joint_id: Source joint ID (e.g., "p1_j0")
-        dst_joint_id: Destination joint ID (e.g., "p2_j0")
+        src_id: Source piece ID (e.g., "p1")
+        dst_id: Destination piece ID (e.g., "p2")
     """
-    src_id = src_joint_id.rsplit("_j", 1)[0]
-    dst_id = dst_joint_id.rsplit("_j", 1)[0]
     src_joint = parts[src_id].joints.get(f"to_{dst_id}")
     dst_joint = parts[dst_id].joints.get(f"to_{src_id}")
     if src_joint and dst_joint:
         src_joint.connect_to(dst_joint)
 
 
+def _spanning_tree_edges(
+    piece_ids: Iterable[str], neighbors: dict[str, dict[str, None]]
+) -> list[tuple[str, str]]:
+    """List the edges of a BFS spanning forest of the connection graph.
+
+    Every connected component is rooted at its first piece in piece_ids,
+    and each other piece appears exactly once as the destination of an edge
+    whose source has already been placed.
+
+    Args:
+        piece_ids: All piece IDs, in placement priority order
+        neighbors: Adjacency of the connection graph by piece ID
+
+    Returns:
+        (placed piece, piece to place) pairs in placement order
+
+    Examples:
+        >>> frame = {
+        ...     "a": {"b": None, "d": None},
+        ...     "b": {"a": None, "c": None},
+        ...     "c": {"b": None, "d": None},
+        ...     "d": {"c": None, "a": None},
+        ... }
+        >>> _spanning_tree_edges(["a", "b", "c", "d", "e"], frame)
+        [('a', 'b'), ('a', 'd'), ('b', 'c')]
+    """
+    edges: list[tuple[str, str]] = []
+    visited: set[str] = set()
+    for root in piece_ids:
+        if root in visited:
+            continue
+        visited.add(root)
+        queue = deque([root])
+        while queue:
+            current = queue.popleft()
+            for neighbor in neighbors.get(current, {}):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    edges.append((current, neighbor))
+                    queue.append(neighbor)
+    return edges
+
+
 def assembly_to_build123d(
     assembly: Assembly,
     fillet_radius: float = 5.0,
@@ -293,68 +331,62 @@ def assembly_to_build123d(
                 pilot_holes=assembly.pilot_holes.get(piece_id),
             )
 
-    # Build graph from connections
-    joints = {}
+    # Both ends of every connection as (piece, other piece, joint id,
+    # flip_dir); target joints face the opposite way
+    ends = []
     for lhs_joint_id, rhs_joint_id in assembly.joint_conns:
-        lhs_joint = assembly.joints[lhs_joint_id]
-        rhs_joint = assembly.joints[rhs_joint_id]
-
         # Extract piece IDs from joint IDs
         lhs_id = lhs_joint_id.rsplit("_j", 1)[0]
         rhs_id = rhs_joint_id.rsplit("_j", 1)[0]
-
-        joints.setdefault(lhs_id, []).append((lhs_joint_id, rhs_joint_id))
-        _create_joint_from(
-            lhs_joint,
-            assembly.boxes[lhs_id],
-            label=f"to_{rhs_id}",
-            to_part=parts[lhs_id],
+        ends.append((lhs_id, rhs_id, lhs_joint_id, False))
+        ends.append((rhs_id, lhs_id, rhs_joint_id, True))
+
+    # Build graph from connections. Neighbors are indexed by piece, so
+    # several joint pairs between the same two pieces (e.g. dowels) form a
+    # single edge, and the joints to use are found by piece ID.
+    neighbors: dict[str, dict[str, None]] = {}
+    for piece_id, other_id, _, _ in ends:
+        neighbors.setdefault(piece_id, {})[other_id] = None
+
+    # Place the parts along a spanning forest of the connection graph: each
+    # part is moved exactly once, by the connection that reaches it first.
+    # Cycle-closing connections (e.g. the fourth side of a frame) are already
+    # satisfied once the rest of the cycle is placed, so their joints are
+    # never connected and are not built at all.
+    tree_edges = _spanning_tree_edges(assembly.boxes, neighbors)
+    tree_pairs = set(tree_edges)
+    tree_pairs.update((dst_id, src_id) for src_id, dst_id in tree_edges)
+    ends = [end for end in ends if (end[0], end[1]) in tree_pairs]
+
+    # Orientations are gathered into one contiguous (N, 6) buffer of
+    # direction and up components and converted in a single vectorized pass
+    # rather than one small numpy call per joint
+    angles = np.empty((0, 3))
+    if ends:
+        orientations = np.array(
+            [_as_row(assembly.joints[end[2]].orientation) for end in ends],
+            dtype=float,
         )
-        joints.setdefault(rhs_id, []).append((rhs_joint_id, lhs_joint_id))
+        flip = np.fromiter((end[3] for end in ends), dtype=bool, count=len(ends))
+        orientations[flip, :3] *= -1.0
+        angles = _as_euler_angles_batch(orientations[:, :3], orientations[:, 3:])
+
+    for (piece_id, other_id, joint_id, _), joint_angles in zip(ends, angles):
         _create_joint_from(
-            rhs_joint,
-            assembly.boxes[rhs_id],
-            label=f"to_{lhs_id}",
-            to_part=parts[rhs_id],
-            flip_dir=True,
+            assembly.joints[joint_id],
+            assembly.boxes[piece_id],
+            label=f"to_{other_id}",
+            to_part=parts[piece_id],
+            angles=tuple(float(angle) for angle in joint_angles),
         )
 
-    # BFS traversal
-    visited = set()
-    processed_edges = set()
-
-    # Process each connected component
-    for start_piece in assembly.boxes:
-        if start_piece in visited:
-            continue
-
-        queue = deque([start_piece])
-        visited.add(start_piece)
-
-        while queue:
-            current_piece_id = queue.popleft()
-
-            # Process all neighbors
-            for current_id, neighbor_id in joints.get(current_piece_id, []):
-                if (current_id, neighbor_id) in processed_edges:
-                    continue
-                if (neighbor_id, current_id) in processed_edges:
-                    continue
-                processed_edges.add((current_id, neighbor_id))
-                processed_edges.add((neighbor_id, current_id))
-
-                _connect(parts, current_id, neighbor_id)
-
-                # Add neighbor to queue if not visited
-                neighbor_piece_id = neighbor_id.rsplit("_j", 1)[0]
-                if neighbor_piece_id not in visited:
-                    visited.add(neighbor_piece_id)
-                    queue.append(neighbor_piece_id)
+    for src_id, dst_id in tree_edges:
+        _connect(parts, src_id, dst_id)
 
     return Compound(label=assembly.label or "assembly", children=list(parts.values()))
 
 
-@dataclass
+@dataclass(slots=True)
 class OverlapResult:
     """Result of overlap detection between pieces.
 
@@ -8,11 +8,13 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+
 from nichiyou_daiku.core.piece import PieceType
 from .resources import ResourceSummary, PieceResource
 
 
-@dataclass
+@dataclass(slots=True)
 class CutPlan:
     """Plan for cutting pieces from a standard board.
 
@@ -48,6 +50,47 @@ def _get_default_standard_lengths() -> Dict[PieceType, List[float]]:
     }
 
 
+def _fit_board(
+    lengths: np.ndarray, remaining: np.ndarray, board_length: float
+) -> list[int]:
+    """Pick pieces for one board, first fit over lengths sorted descending.
+
+    Once a piece does not fit, no longer piece fits either and the used
+    length only grows, so every pick is the first remaining row at or after
+    the previous pick that still fits. Each pick is found with one array
+    comparison instead of revisiting the pieces in Python.
+
+    Args:
+        lengths: Piece lengths in mm, sorted in descending order
+        remaining: Mask of the pieces that are not cut yet
+        board_length: Length of the board in mm
+
+    Returns:
+        Rows of the pieces cut from the board, in cutting order
+
+    Examples:
+        >>> lengths = np.array([1500.0, 1000.0, 800.0, 600.0])
+        >>> remaining = np.array([True, True, True, True])
+        >>> _fit_board(lengths, remaining, 2440.0)
+        [0, 2]
+        >>> _fit_board(lengths, remaining, 500.0)
+        []
+    """
+    cut_rows: list[int] = []
+    used_length = 0.0
+    start = 0
+    while start < len(lengths):
+        fits = remaining[start:] & (used_length + lengths[start:] <= board_length)
+        offset = int(np.argmax(fits))
+        if not fits[offset]:
+            break
+        row = start + offset
+        cut_rows.append(row)
+        used_length += lengths[row]
+        start = row + 1
+    return cut_rows
+
+
 def _optimize_cuts(
     pieces: List[PieceResource], available_lengths: List[float]
 ) -> List[CutPlan]:
@@ -82,47 +125,46 @@ def _optimize_cuts(
     """
     # Sort pieces by length (descending) for better optimization
     sorted_pieces = sorted(pieces, key=lambda p: p.length, reverse=True)
+    lengths = np.array([p.length for p in sorted_pieces], dtype=float)
 
     # Sort available lengths (ascending) to prefer smaller boards when possible
     sorted_lengths = sorted(available_lengths)
 
     cut_plans = []
-    remaining_pieces = sorted_pieces.copy()
+    remaining = np.ones(len(sorted_pieces), dtype=bool)
 
-    while remaining_pieces:
+    while remaining.any():
         # Find the best board length for remaining pieces
         best_plan = None
         best_waste = float("inf")
-        best_remaining = remaining_pieces
+        best_cut_rows: list[int] = []
 
         for board_length in sorted_lengths:
-            cuts = []
-            used_length = 0.0
-            temp_remaining = remaining_pieces.copy()
-
-            # Try to fit as many pieces as possible
-            for piece in remaining_pieces:
-                if used_length + piece.length <= board_length:
-                    cuts.append((piece.id, piece.length))
-                    used_length += piece.length
-                    temp_remaining.remove(piece)
-
-            if cuts:  # If we can fit at least one piece
+            cut_rows = _fit_board(lengths, remaining, board_length)
+
+            if cut_rows:  # If we can fit at least one piece
+                used_length = float(sum(lengths[row] for row in cut_rows))
                 waste = board_length - used_length
                 if waste < best_waste:
                     best_waste = waste
                     best_plan = CutPlan(
-                        board_length=board_length, cuts=cuts, waste=waste
+                        board_length=board_length,
+                        cuts=[
+                            (sorted_pieces[row].id, sorted_pieces[row].length)
+                            for row in cut_rows
+                        ],
+                        waste=waste,
                     )
-                    best_remaining = temp_remaining
+                    best_cut_rows = cut_rows
 
         if best_plan:
             cut_plans.append(best_plan)
-            remaining_pieces = best_remaining
+            remaining[best_cut_rows] = False
         else:
             # If no standard length can fit the largest remaining piece
             # Use the largest available length
-            largest_piece = remaining_pieces[0]
+            largest_row = int(np.argmax(remaining))
+            largest_piece = sorted_pieces[largest_row]
             largest_length = max(sorted_lengths)
             cut_plans.append(
                 CutPlan(
@@ -131,7 +173,7 @@ def _optimize_cuts(
                     waste=largest_length - largest_piece.length,
                 )
             )
-            remaining_pieces.remove(largest_piece)
+            remaining[largest_row] = False
 
     return cut_plans
 
@@ -6,11 +6,12 @@ This module provides functionality to extract and summarize the resources
 
 from typing import Dict
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict
 
 from nichiyou_daiku.core.assembly import Assembly, Hole
 from nichiyou_daiku.core.geometry import Point3D, Box
-from nichiyou_daiku.core.piece import PieceType, get_shape
+from nichiyou_daiku.core.piece import PieceType
 from nichiyou_daiku.shell.utils import detect_face_from_point
 
 
@@ -214,6 +215,52 @@ class ResourceSummary(BaseModel):
 
         return "\n".join(lines)
 
+    def preview_json(self, max_chars: int = 500) -> str:
+        """Generate the beginning of the indented JSON export.
+
+        Gives the same text as cutting model_dump_json(indent=2) at
+        max_chars, followed by "..." when it was cut. Pieces come first in
+        the export, so only as many leading pieces as the preview needs are
+        serialized instead of the whole summary.
+
+        Args:
+            max_chars: Maximum number of JSON characters to keep
+
+        Returns:
+            JSON preview string
+
+        Examples:
+            >>> from nichiyou_daiku.core.piece import PieceType
+            >>> summary = ResourceSummary(
+            ...     pieces=[
+            ...         PieceResource(
+            ...             id=f"p{i}", type=PieceType.PT_2x4, length=1000.0,
+            ...             width=89.0, height=38.0, volume=3_382_000.0
+            ...         )
+            ...         for i in range(100)
+            ...     ],
+            ...     total_pieces=100,
+            ...     pieces_by_type={PieceType.PT_2x4: 100},
+            ...     total_length_by_type={PieceType.PT_2x4: 100_000.0},
+            ...     total_volume=338_200_000.0
+            ... )
+            >>> full = summary.model_dump_json(indent=2)
+            >>> summary.preview_json(300) == full[:300] + "..."
+            True
+        """
+        count = 1
+        while count < len(self.pieces):
+            head = self.model_copy(update={"pieces": self.pieces[:count]})
+            text = head.model_dump_json(indent=2)
+            # Up to the closing bracket of the pieces list, the text matches
+            # the export of the whole summary
+            if text.index("\n  ]") >= max_chars:
+                return text[:max_chars] + "..."
+            count *= 2
+
+        text = self.model_dump_json(indent=2)
+        return text[:max_chars] + "..." if len(text) > max_chars else text
+
 
 def _point3d_to_pilot_hole_info(
     point: Point3D, hole: Hole, box: Box
@@ -299,79 +346,63 @@ def extract_resources(assembly: Assembly) -> ResourceSummary:
     """
     # Extract anchor information from connections via model
     piece_anchors: Dict[str, list[AnchorInfo]] = {}
-
     for connection in assembly.model.connections.values():
-        base_id, target_id = connection.base.piece.id, connection.target.piece.id
-        # Add base_anchor to base piece
-        if base_id not in piece_anchors:
-            piece_anchors[base_id] = []
-
-        base_anchor = connection.base.anchor
-        offset_type = type(base_anchor.offset).__name__
-        piece_anchors[base_id].append(
-            AnchorInfo(
-                contact_face=base_anchor.contact_face,
-                edge_shared_face=base_anchor.edge_shared_face,
-                offset_type=offset_type,
-                offset_value=base_anchor.offset.value,
+        for bound in (connection.base, connection.target):
+            piece_anchors.setdefault(bound.piece.id, []).append(
+                AnchorInfo(
+                    contact_face=bound.anchor.contact_face,
+                    edge_shared_face=bound.anchor.edge_shared_face,
+                    offset_type=type(bound.anchor.offset).__name__,
+                    offset_value=bound.anchor.offset.value,
+                )
             )
-        )
-
-        # Add target_anchor to target piece
-        if target_id not in piece_anchors:
-            piece_anchors[target_id] = []
-
-        target_anchor = connection.target.anchor
-        offset_type = type(target_anchor.offset).__name__
-        piece_anchors[target_id].append(
-            AnchorInfo(
-                contact_face=target_anchor.contact_face,
-                edge_shared_face=target_anchor.edge_shared_face,
-                offset_type=offset_type,
-                offset_value=target_anchor.offset.value,
-            )
-        )
 
     # Extract pilot hole information
-    piece_pilot_holes: Dict[str, list[PilotHoleInfo]] = {}
-    for piece_id, holes in assembly.pilot_holes.items():
-        box = assembly.boxes[piece_id]
-        piece_pilot_holes[piece_id] = [
-            _point3d_to_pilot_hole_info(point, hole, box) for point, hole in holes
+    piece_pilot_holes: Dict[str, list[PilotHoleInfo]] = {
+        piece_id: [
+            _point3d_to_pilot_hole_info(point, hole, assembly.boxes[piece_id])
+            for point, hole in holes
         ]
-
-    # Extract piece resources from model
-    pieces_list = []
-    pieces_by_type: Dict[PieceType, int] = {}
-    total_length_by_type: Dict[PieceType, float] = {}
-    total_volume = 0.0
-
-    for piece in assembly.model.pieces.values():
-        # Get the 3D shape with actual dimensions
-        shape = get_shape(piece)
-
-        # Calculate volume
-        volume = shape.width * shape.height * shape.length
-
-        # Create resource entry with anchors and pilot holes
-        resource = PieceResource(
+        for piece_id, holes in assembly.pilot_holes.items()
+    }
+
+    # Extract piece resources from model. The model's column-wise view gives
+    # widths and heights from a per-type cross-section table, so no per-piece
+    # shape objects are built and volumes and per-type totals are computed
+    # in bulk.
+    arrays = assembly.model.as_arrays()
+    volumes = arrays.widths * arrays.heights * arrays.lengths
+
+    pieces_list = [
+        PieceResource(
             id=piece.id,
             type=piece.type,
             length=piece.length,
-            width=shape.width,
-            height=shape.height,
-            volume=volume,
+            width=float(width),
+            height=float(height),
+            volume=float(volume),
             anchors=piece_anchors.get(piece.id, []),
             pilot_holes=piece_pilot_holes.get(piece.id, []),
         )
-        pieces_list.append(resource)
-
-        # Update aggregates
-        pieces_by_type[piece.type] = pieces_by_type.get(piece.type, 0) + 1
-        total_length_by_type[piece.type] = (
-            total_length_by_type.get(piece.type, 0.0) + piece.length
+        for piece, width, height, volume in zip(
+            assembly.model.pieces.values(), arrays.widths, arrays.heights, volumes
         )
-        total_volume += volume
+    ]
+
+    # Aggregate by lumber type, keeping the types in first-seen order
+    counts = np.bincount(arrays.type_rows, minlength=len(arrays.types))
+    total_lengths = np.bincount(
+        arrays.type_rows, weights=arrays.lengths, minlength=len(arrays.types)
+    )
+
+    pieces_by_type = {
+        piece_type: int(count) for piece_type, count in zip(arrays.types, counts)
+    }
+    total_length_by_type = {
+        piece_type: float(total_length)
+        for piece_type, total_length in zip(arrays.types, total_lengths)
+    }
+    total_volume = float(volumes.sum())
 
     return ResourceSummary(
         pieces=pieces_list,
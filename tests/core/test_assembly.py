@@ -191,6 +191,41 @@ class TestAssembly:
         # For now, just check the structure exists and is empty (stub returns [])
         # When implemented, this test should verify actual holes are generated
 
+    def test_should_not_share_assembly_between_calls(self):
+        """Should build independent assemblies for models with equal content."""
+        from nichiyou_daiku.core.model import Model
+
+        p1 = Piece.of(PieceType.PT_2x4, 1000.0, "p1")
+        p2 = Piece.of(PieceType.PT_2x4, 800.0, "p2")
+        conn = Connection(
+            base=BoundAnchor(
+                piece=p1,
+                anchor=Anchor(
+                    contact_face="front",
+                    edge_shared_face="top",
+                    offset=FromMax(value=100),
+                ),
+            ),
+            target=BoundAnchor(
+                piece=p2,
+                anchor=Anchor(
+                    contact_face="down",
+                    edge_shared_face="front",
+                    offset=FromMin(value=50),
+                ),
+            ),
+        )
+
+        first = Assembly.of(Model.of(pieces=[p1, p2], connections=[conn]))
+        first.joints.clear()
+        first.pilot_holes.clear()
+        second = Assembly.of(Model.of(pieces=[p2, p1], connections=[conn]))
+
+        assert second is not first
+        assert len(second.joints) == 2
+        assert len(second.joint_conns) == 1
+        assert set(second.pilot_holes) == {"p1", "p2"}
+
     # Assembly.of() method is covered in doctests
 
 
@@ -64,6 +64,39 @@ class TestModel:
         assert len(model.pieces) == 1
         assert model.pieces["same-id"].length == 2000.0
 
+    def test_should_build_model_from_generators(self):
+        """Should index pieces and connections given as generators."""
+        pieces = [Piece.of(PieceType.PT_2x4, 100.0 + i, f"p{i}") for i in range(50)]
+
+        model = Model.of(
+            pieces=(piece for piece in pieces),
+            connections=(
+                Connection(
+                    base=BoundAnchor(
+                        piece=base,
+                        anchor=Anchor(
+                            contact_face="top",
+                            edge_shared_face="left",
+                            offset=FromMin(value=0),
+                        ),
+                    ),
+                    target=BoundAnchor(
+                        piece=target,
+                        anchor=Anchor(
+                            contact_face="down",
+                            edge_shared_face="left",
+                            offset=FromMin(value=0),
+                        ),
+                    ),
+                )
+                for base, target in zip(pieces, pieces[1:])
+            ),
+        )
+
+        assert list(model.pieces) == [piece.id for piece in pieces]
+        assert len(model.connections) == 49
+        assert ("p48", "p49") in model.connections
+
     def test_should_create_simple_l_angle_model(self):
         """Should create a model representing an L-angle joint."""
         # Create two pieces
@@ -157,6 +190,62 @@ class TestModel:
         assert ("main", "branch2") in model.connections
 
 
+class TestModelHash:
+    """Test Model hashing."""
+
+    def test_should_hash_equal_models_equally(self):
+        """Models with the same content should hash the same."""
+        piece1 = Piece.of(PieceType.PT_2x4, 1000.0, "p1")
+        piece2 = Piece.of(PieceType.PT_2x4, 800.0, "p2")
+
+        lhs = Model.of(pieces=[piece1, piece2], connections=[], label="m")
+        rhs = Model.of(pieces=[piece2, piece1], connections=[], label="m")
+
+        assert lhs == rhs
+        assert hash(lhs) == hash(rhs)
+        assert len({lhs, rhs}) == 1
+
+    def test_should_distinguish_models_with_different_pieces(self):
+        """Models with different pieces should not compare equal."""
+        short = Model.of(
+            pieces=[Piece.of(PieceType.PT_2x4, 800.0, "p1")], connections=[]
+        )
+        long = Model.of(
+            pieces=[Piece.of(PieceType.PT_2x4, 900.0, "p1")], connections=[]
+        )
+
+        assert len({short, long}) == 2
+
+    def test_should_rehash_copied_models(self):
+        """A copy with changed fields should hash like an equal new model."""
+        pieces = [Piece.of(PieceType.PT_2x4, 800.0, "p1")]
+        original = Model.of(pieces=pieces, connections=[])
+        hash(original)
+
+        copied = original.model_copy(update={"label": "x"})
+        fresh = Model.of(pieces=pieces, connections=[], label="x")
+
+        assert copied == fresh
+        assert hash(copied) == hash(fresh)
+
+
+class TestPieceArrays:
+    """Test the column-wise piece view."""
+
+    # Layout of a mixed-type model is covered in doctests
+
+    def test_should_lay_out_empty_model(self):
+        """An empty model should give empty, correctly shaped arrays."""
+        arrays = Model.of(pieces=[], connections=[]).as_arrays()
+
+        assert arrays.ids == ()
+        assert arrays.types == ()
+        assert arrays.type_rows.shape == (0,)
+        assert arrays.lengths.shape == (0,)
+        assert arrays.widths.shape == (0,)
+        assert arrays.heights.shape == (0,)
+
+
 class TestModelValidation:
     """Test Model validation rules."""
 
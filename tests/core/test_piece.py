@@ -45,6 +45,23 @@ class TestPiece:
         with pytest.raises(ValidationError):
             Piece(id="test", type=PieceType.PT_2x4, length=-100)
 
+    def test_should_create_many_pieces_equal_to_single_creation(self):
+        """Should build the same pieces as Piece.of, validating lengths."""
+        from pydantic import ValidationError
+
+        pieces = Piece.of_many(PieceType.PT_1x4, [0, 150.5, 300], ["a", "b", "c"])
+        assert pieces == [
+            Piece.of(PieceType.PT_1x4, 0.0, "a"),
+            Piece.of(PieceType.PT_1x4, 150.5, "b"),
+            Piece.of(PieceType.PT_1x4, 300.0, "c"),
+        ]
+        assert all(isinstance(piece.length, float) for piece in pieces)
+
+        with pytest.raises(ValidationError):
+            Piece.of_many(PieceType.PT_2x4, [100.0, -1.0], ["a", "b"])
+        with pytest.raises(ValueError):
+            Piece.of_many(PieceType.PT_2x4, [100.0], ["a", "b"])
+
 
 class TestFace:
     """Test Face literal type."""
@@ -80,3 +97,8 @@ class TestGetShape:
             assert shape.length == length
             assert shape.width == 89.0
             assert shape.height == 38.0
+
+    def test_should_reuse_cross_section_for_piece_type(self):
+        """Should return the same cached Shape2D for repeated lookups."""
+        for piece_type in PieceType:
+            assert get_shape(piece_type) is get_shape(piece_type)
@@ -111,6 +111,11 @@ class TestGetSpec:
         spec = as_spec(SlimScrew.D3_3_L25)
         assert isinstance(spec, ScrewSpec)
 
+    def test_get_spec_shares_instance_per_preset(self):
+        """get_spec should return one shared spec per preset."""
+        for screw in [*SlimScrew, *CoarseThreadScrew]:
+            assert as_spec(screw) is as_spec(screw)
+
 
 class TestScrewPresetType:
     """ScrewPreset type alias tests."""
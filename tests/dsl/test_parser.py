@@ -3,7 +3,13 @@
 import pytest
 
 from nichiyou_daiku.core.piece import PieceType
-from nichiyou_daiku.dsl import DSLSyntaxError, parse_dsl
+from nichiyou_daiku.dsl import (
+    DSLSyntaxError,
+    DSLValidationError,
+    compile_dsl,
+    parse_dsl,
+    parse_dsl_stream,
+)
 
 
 class TestBasicParsing:
@@ -53,6 +59,17 @@ class TestBasicParsing:
         assert model.pieces["beam2"].length == 2000.0
         assert model.pieces["board1"].type == PieceType.PT_1x4
 
+    def test_parse_utf8_bytes(self):
+        """Test parsing a document given as UTF-8 encoded bytes."""
+        dsl = """
+        // 脚 (leg)
+        (leg:2x4 =720)
+        """
+        model = parse_dsl(dsl.encode("utf-8"))
+
+        assert model == parse_dsl(dsl)
+        assert model.pieces["leg"].length == 720.0
+
     def test_parse_piece_with_connection(self):
         """Test parsing pieces with a connection."""
         dsl = """
@@ -342,3 +359,136 @@ class TestEdgeCases:
         # Should not raise an exception
         model = parse_dsl(dsl, debug=True)
         assert len(model.pieces) == 1
+
+
+class TestParserReuse:
+    """Test that parsers and parse results can be reused safely."""
+
+    def test_parser_instance_can_parse_several_documents(self):
+        """A DSLParser should not carry pieces over between documents."""
+        from nichiyou_daiku.dsl.parser import DSLParser
+
+        parser = DSLParser()
+        first = parser.parse('(beam1:2x4 {"length": 1000})')
+        second = parser.parse('(beam2:2x4 {"length": 2000})')
+
+        assert list(first.pieces) == ["beam1"]
+        assert list(second.pieces) == ["beam2"]
+
+    def test_repeated_parse_returns_independent_models(self):
+        """Parsing identical text should build a new, equal model each time."""
+        dsl = """
+        (beam1:2x4 {"length": 1000})
+        (beam2:2x4 {"length": 1000})
+        beam1 -[TL<0 DF>0]- beam2
+        """
+        first = parse_dsl(dsl)
+        first.pieces.pop("beam1")
+        second = parse_dsl(dsl)
+
+        assert second is not first
+        assert list(second.pieces) == ["beam1", "beam2"]
+        assert len(second.connections) == 1
+
+    def test_repeated_parse_generates_fresh_ids(self):
+        """Pieces without an ID should get a new ID on every parse."""
+        dsl = '(:2x4 {"length": 1000})'
+
+        assert list(parse_dsl(dsl).pieces) != list(parse_dsl(dsl).pieces)
+
+    def test_errors_are_not_cached(self):
+        """Invalid input should raise on every call."""
+        for _ in range(2):
+            with pytest.raises(DSLSyntaxError):
+                parse_dsl("(beam1:2x4")
+
+
+class TestTemplates:
+    """Test DSL templates with "$name" parameters."""
+
+    TEMPLATE = """
+    (leg:2x4 =$height)
+    (apron:2x4 {"length": $width})
+    leg -[BL<$apron_height DR<0 D($dowel, 20)]- apron
+    """
+
+    def test_instantiate_binds_parameters(self):
+        """Each instantiation should use its own parameter values."""
+        template = compile_dsl(self.TEMPLATE)
+        assert template.parameters == {"height", "width", "apron_height", "dowel"}
+
+        low = template.instantiate(height=700, width=500, apron_height=90, dowel=8)
+        high = template.instantiate(height=750.5, width=520, apron_height=100, dowel=10)
+
+        assert low.pieces["leg"].length == 700.0
+        assert low.pieces["apron"].length == 500.0
+        assert high.pieces["leg"].length == 750.5
+        connection = high.connections[("leg", "apron")]
+        assert connection.base.anchor.offset.value == 100.0
+
+    def test_instantiate_matches_parsed_document(self):
+        """A bound template should build the same model as literal text."""
+        template = compile_dsl(self.TEMPLATE)
+        literal = self.TEMPLATE.replace("$height", "720").replace("$width", "600")
+        literal = literal.replace("$apron_height", "100").replace("$dowel", "8")
+
+        assert template.instantiate(
+            height=720, width=600, apron_height=100, dowel=8
+        ) == parse_dsl(literal)
+
+    def test_missing_and_unknown_parameters(self):
+        """Parameters must be bound exactly."""
+        template = compile_dsl("(leg:2x4 =$height)")
+
+        with pytest.raises(DSLValidationError, match="Missing .*height"):
+            template.instantiate()
+        with pytest.raises(DSLValidationError, match="Unknown .*width"):
+            template.instantiate(height=700, width=500)
+        with pytest.raises(DSLValidationError, match="must be a number"):
+            template.instantiate(height="tall")
+
+    def test_parse_dsl_rejects_parameters(self):
+        """Plain documents should not accept template parameters."""
+        with pytest.raises(DSLSyntaxError):
+            parse_dsl("(leg:2x4 =$height)")
+
+
+class TestStreamParsing:
+    """Test parsing documents supplied as chunks."""
+
+    CHUNKS = [
+        '// Frame\n(beam1:2x4 {"length": 1000})\n',
+        "(beam2:2x4 =800)\n",
+        "// no statements in this chunk\n",
+        "beam1 -[TL<0 DF>0]- beam2\n",
+    ]
+
+    def test_stream_matches_whole_document(self):
+        """Streaming chunks should build the same model as the joined text."""
+        assert parse_dsl_stream(iter(self.CHUNKS)) == parse_dsl("".join(self.CHUNKS))
+
+    def test_syntax_error_reports_document_line(self):
+        """Line numbers should count from the start of the document."""
+        chunks = self.CHUNKS + ["(beam3:2x4"]
+        with pytest.raises(DSLSyntaxError) as streamed:
+            parse_dsl_stream(chunks)
+        with pytest.raises(DSLSyntaxError) as whole:
+            parse_dsl("".join(chunks))
+
+        assert streamed.value.line == whole.value.line == 6
+
+    def test_syntax_error_position_after_unterminated_chunk(self):
+        """Chunks not ending with a newline should continue the same line."""
+        chunks = ["(beam1:2x4 =1000)\n(beam2:2x4 =800) ", "(beam3:2x4 =600) ", "(x"]
+        with pytest.raises(DSLSyntaxError) as streamed:
+            parse_dsl_stream(chunks)
+        with pytest.raises(DSLSyntaxError) as whole:
+            parse_dsl("".join(chunks))
+
+        assert (streamed.value.line, streamed.value.column) == (2, 36)
+        assert (whole.value.line, whole.value.column) == (2, 36)
+
+    def test_statement_cannot_span_chunks(self):
+        """Each chunk must hold complete statements."""
+        with pytest.raises(DSLSyntaxError):
+            parse_dsl_stream(["(beam1:2x4 ", "=1000)"])
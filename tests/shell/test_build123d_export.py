@@ -369,6 +369,40 @@ class TestAssemblyToBuild123d:
                 importlib.reload(export_module)
 
 
+class TestEulerAnglesBatch:
+    """Test vectorized joint orientation conversion."""
+
+    def test_should_convert_all_orientations_at_once(self):
+        """Should return one row of Euler angles per orientation."""
+        import numpy as np
+
+        from nichiyou_daiku.shell.build123d_export import _as_euler_angles_batch
+
+        directions = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, -1.0], [0.0, 1.0, 0.0]])
+        ups = np.array([[1.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+
+        angles = _as_euler_angles_batch(directions, ups)
+
+        assert angles.shape == (3, 3)
+        np.testing.assert_allclose(angles[0], [180.0, 0.0, -90.0], atol=1e-9)
+        np.testing.assert_allclose(angles[1], [0.0, 0.0, -90.0], atol=1e-9)
+        np.testing.assert_allclose(angles[2], [90.0, 0.0, 0.0], atol=1e-9)
+
+    def test_should_handle_gimbal_lock(self):
+        """Should resolve directions along the X axis without NaNs."""
+        import numpy as np
+
+        from nichiyou_daiku.shell.build123d_export import _as_euler_angles_batch
+
+        directions = np.array([[1.0, 0.0, 0.0], [-1.0, 0.0, 0.0]])
+        ups = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, 1.0]])
+
+        angles = _as_euler_angles_batch(directions, ups)
+
+        np.testing.assert_allclose(angles[0], [90.0, -90.0, 0.0], atol=1e-9)
+        np.testing.assert_allclose(angles[1], [90.0, 90.0, 0.0], atol=1e-9)
+
+
 class TestCheckOverlap:
     """Test check_overlap function."""
 
@@ -535,3 +569,35 @@ class TestCheckOverlap:
                 assert result.volume == 10.0
             finally:
                 export_module.HAS_BUILD123D = original_available
+
+
+class TestLazyExport:
+    """Test that the shell package loads the exporter on demand."""
+
+    def test_should_not_import_exporter_with_shell_package(self):
+        """Should leave build123d unloaded until assembly_to_build123d is used."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, nichiyou_daiku.shell; "
+            "print('nichiyou_daiku.shell.build123d_export' in sys.modules, "
+            "'build123d' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.split() == ["False", "False"]
+
+    def test_should_expose_exporter_on_lookup_when_available(self):
+        """Should resolve assembly_to_build123d from the exporter module."""
+        import nichiyou_daiku.shell as shell
+        import nichiyou_daiku.shell.build123d_export as export_module
+
+        with patch.object(export_module, "HAS_BUILD123D", True):
+            assert shell.assembly_to_build123d is export_module.assembly_to_build123d
+
+        with patch.object(export_module, "HAS_BUILD123D", False):
+            with pytest.raises(AttributeError):
+                shell.assembly_to_build123d
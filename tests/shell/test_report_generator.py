@@ -118,6 +118,28 @@ class TestOptimizeCuts:
         assert all(plan.board_length == 2440.0 for plan in plans)
         assert all(len(plan.cuts) == 1 for plan in plans)
 
+    def test_should_fill_board_with_shorter_pieces_after_skipping(self):
+        """Should keep fitting shorter pieces after a longer one is skipped."""
+        pieces = [
+            PieceResource(
+                id=f"p{i}",
+                type=PieceType.PT_2x4,
+                length=length,
+                width=89.0,
+                height=38.0,
+                volume=0,
+            )
+            for i, length in enumerate([600.0, 1500.0, 800.0, 1000.0])
+        ]
+
+        plans = _optimize_cuts(pieces, [2440.0])
+
+        assert [plan.cuts for plan in plans] == [
+            [("p1", 1500.0), ("p2", 800.0)],
+            [("p3", 1000.0), ("p0", 600.0)],
+        ]
+        assert [plan.waste for plan in plans] == [140.0, 840.0]
+
     def test_should_choose_optimal_board_length(self):
         """Should choose the most efficient board length."""
         pieces = [
@@ -124,6 +124,32 @@ class TestResourceSummary:
         assert "2x4" in data["pieces_by_type"]
         assert data["pieces_by_type"]["2x4"] == 2
 
+    @pytest.mark.parametrize("piece_num", [0, 1, 3, 40])
+    @pytest.mark.parametrize("max_chars", [0, 120, 500, 100_000])
+    def test_preview_json_should_match_cut_full_export(self, piece_num, max_chars):
+        """Should preview the same text as cutting the full JSON export."""
+        summary = ResourceSummary(
+            pieces=[
+                PieceResource(
+                    id=f"piece_{i}",
+                    type=PieceType.PT_2x4,
+                    length=1000.0,
+                    width=89.0,
+                    height=38.0,
+                    volume=3_382_000.0,
+                )
+                for i in range(piece_num)
+            ],
+            total_pieces=piece_num,
+            pieces_by_type={PieceType.PT_2x4: piece_num},
+            total_length_by_type={PieceType.PT_2x4: piece_num * 1000.0},
+            total_volume=piece_num * 3_382_000.0,
+        )
+
+        full = summary.model_dump_json(indent=2)
+        expected = full[:max_chars] + "..." if len(full) > max_chars else full
+        assert summary.preview_json(max_chars) == expected
+
     def test_pretty_print_formatting(self):
         """Should generate human-readable summary."""
         summary = ResourceSummary(